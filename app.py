@@ -5,28 +5,22 @@ This is the new modular version of the ARIA application with improved
 structure and separation of concerns.
 """
 
+import importlib
 import os
 import sys
-from pathlib import Path
+from typing import Any, Callable
 
 # Add src directory to Python path so we can import aria modules
-src_path = Path(__file__).parent / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+_SRC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
+if _SRC_PATH not in sys.path:
+    sys.path.insert(0, _SRC_PATH)
 
 import streamlit as st
 from aria.ui.state_manager import StateManager
 from aria.ui.components.stepper import render_stepper
 from aria.ui.components.file_preview import render_file_preview
-from aria.ui.styles.css import (
-    load_custom_css, load_header_css, load_sidebar_css, 
-    load_font_imports, apply_step_specific_css
-)
+from aria.ui.styles.css import load_app_css
 from aria.ui.pages.step1_upload import render_upload_page
-from aria.ui.pages.step2_extract import render_extract_page
-from aria.ui.pages.step3_generate import render_generate_page
-from aria.ui.pages.step4_download import render_download_page
-from aria.ui.pages.adhoc_questions import render_adhoc_questions_page
 from aria.config.config import config, SESSION_KEYS
 from aria.core.logging_config import setup_logging, log_info, log_error
 from aria.core.types import ProcessingStep
@@ -39,6 +33,78 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Custom header HTML with domain-specific title, plus a spacer so content
+# doesn't hide behind the fixed header
+_HEADER_HTML = f"""
+    <div id="customHeader">
+        <h1>{config.domain.app_title}</h1>
+    </div>
+    <div style='height: 15px;'></div>
+    """
+
+# Session state keys read on every rerun
+_EXTRACTION_IN_PROGRESS_KEY = SESSION_KEYS.EXTRACTION_IN_PROGRESS
+_GENERATION_IN_PROGRESS_KEY = SESSION_KEYS.GENERATION_IN_PROGRESS
+_UPLOADED_FILE_KEY = SESSION_KEYS.uploaded_file
+_ADHOC_PROCESSING_KEY = "adhoc_processing"
+
+# Sidebar mode switcher labels mapped to the internal mode names
+_MODE_MAP = {"Document Processing": "document", "Chat": "chat"}
+_MODE_OPTIONS = list(_MODE_MAP)
+
+# Page renderers that are only imported once the user actually reaches them
+_LAZY_RENDERERS = {
+    "render_extract_page": "aria.ui.pages.step2_extract",
+    "render_generate_page": "aria.ui.pages.step3_generate",
+    "render_download_page": "aria.ui.pages.step4_download",
+    "render_adhoc_questions_page": "aria.ui.pages.adhoc_questions",
+    "render_chat_sidebar": "aria.ui.pages.adhoc_questions",
+}
+
+# Page renderer for each document processing step
+_PAGE_RENDERERS = {
+    ProcessingStep.UPLOAD: "render_upload_page",
+    ProcessingStep.EXTRACT: "render_extract_page",
+    ProcessingStep.GENERATE: "render_generate_page",
+    ProcessingStep.DOWNLOAD: "render_download_page",
+}
+
+
+def _lazy(name: str) -> Callable[..., Any]:
+    """Resolve a page renderer on first use and cache it in module globals.
+    
+    Args:
+        name: Name of an already imported renderer or one listed in ``_LAZY_RENDERERS``
+        
+    Returns:
+        The resolved renderer function
+    """
+    fn = globals().get(name)
+    if fn is None:
+        module = importlib.import_module(_LAZY_RENDERERS[name])
+        fn = getattr(module, name)
+        globals()[name] = fn
+    return fn
+
+
+# Sidebar content for each mode
+_SIDEBAR_RENDERERS: dict[str, Callable[[StateManager], None]] = {
+    "document": render_file_preview,
+    "chat": lambda state_manager: _lazy("render_chat_sidebar")(),
+}
+
+
+@st.cache_resource
+def _bootstrap_configuration() -> tuple[bool, list[str]]:
+    """Log and validate the configuration once per process.
+    
+    Returns:
+        Tuple of (is_valid, list_of_errors)
+    """
+    # Log configuration (without sensitive data)
+    config.log_configuration()
+    return config.validate_configuration()
+
 
 def initialize_application() -> None:
     """Initialize the application with logging and configuration."""
@@ -48,11 +114,8 @@ def initialize_application() -> None:
     # Log application startup
     log_info("ARIA application starting up")
     
-    # Log configuration (without sensitive data)
-    config.log_configuration()
-    
-    # Validate configuration
-    is_valid, errors = config.validate_configuration()
+    # Log and validate configuration once per process
+    is_valid, errors = _bootstrap_configuration()
     if not is_valid:
         log_error("Configuration validation failed")
         st.error("Configuration errors detected:")
@@ -65,19 +128,7 @@ def initialize_application() -> None:
 
 def render_header() -> None:
     """Render the application header."""
-    # Load fonts and header CSS
-    load_font_imports()
-    load_header_css()
-    
-    # Custom header HTML with domain-specific title
-    st.markdown(f"""
-    <div id="customHeader">
-        <h1>{config.domain.app_title}</h1>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Add spacer so content doesn't hide behind header
-    st.markdown("<div style='height: 15px;'></div>", unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
 
 def render_sidebar(state_manager: StateManager) -> None:
@@ -87,74 +138,64 @@ def render_sidebar(state_manager: StateManager) -> None:
         state_manager: State manager instance
     """
     # Detect if any critical operation is in progress
-    extraction_in_progress = st.session_state.get(SESSION_KEYS["EXTRACTION_IN_PROGRESS"], False)
-    generation_in_progress = st.session_state.get(SESSION_KEYS["GENERATION_IN_PROGRESS"], False)
-    adhoc_processing = st.session_state.get('adhoc_processing', False)
-    mode_switch_disabled = extraction_in_progress or generation_in_progress or adhoc_processing
+    session_state = st.session_state
+    mode_switch_disabled = (
+        session_state.get(_EXTRACTION_IN_PROGRESS_KEY, False)
+        or session_state.get(_GENERATION_IN_PROGRESS_KEY, False)
+        or session_state.get(_ADHOC_PROCESSING_KEY, False)
+    )
 
     # Mode switcher at the top (dropdown, widget state is source of truth)
-    mode_options = ["Document Processing", "Chat"]
     selected_mode = st.sidebar.selectbox(
         "Choose Mode",
-        options=mode_options,
+        options=_MODE_OPTIONS,
         key="mode_switcher",
         help="Switching modes is disabled while a process is running.",
         disabled=mode_switch_disabled
     )
-    st.session_state["mode"] = "document" if selected_mode == "Document Processing" else "chat"
+    mode = _MODE_MAP[selected_mode]
+    st.session_state["mode"] = mode
 
     if mode_switch_disabled:
         st.sidebar.info("🔒 Mode switching is disabled while processing. Please wait for the current operation to finish.")
 
-    # Load sidebar CSS
-    load_sidebar_css()
-
     # Show sidebar content based on mode
-    if st.session_state["mode"] == "document":
-        render_file_preview(state_manager)
-    elif st.session_state["mode"] == "chat":
-        from aria.ui.pages.adhoc_questions import render_chat_sidebar
-        render_chat_sidebar()
+    _SIDEBAR_RENDERERS[mode](state_manager)
 
 
 def main() -> None:
     """Main application function."""
     # Initialize application
     initialize_application()
-    # Load main CSS styles
-    load_custom_css()
     # Render header
     render_header()
     # Initialize state manager
     state_manager = StateManager()
+    state_manager.ensure_initialized()
     # Render sidebar (now includes mode switcher)
     render_sidebar(state_manager)
+    mode = st.session_state.get("mode", "document")
+    current_step = state_manager.get_current_step()
+    # Load fonts and all CSS (including step-specific styles) in one injection
+    load_app_css(current_step if mode == "document" else None)
 
     # Display welcome message from domain config
-    if state_manager.get_current_step() == ProcessingStep.UPLOAD and not st.session_state.get(SESSION_KEYS["uploaded_file"]):
+    if current_step == ProcessingStep.UPLOAD and not st.session_state.get(_UPLOADED_FILE_KEY):
         st.info("Upload your document to get started with AI-powered question extraction and answer generation.")
 
     # Route based on mode
-    mode = st.session_state.get("mode", "document")
     if mode == "chat":
-        render_adhoc_questions_page(state_manager)
+        _lazy("render_adhoc_questions_page")(state_manager)
         return
     # Document processing workflow
-    current_step = state_manager.get_current_step()
-    apply_step_specific_css(current_step)
     render_stepper(current_step)
-    if current_step == ProcessingStep.UPLOAD:
-        render_upload_page(state_manager)
-    elif current_step == ProcessingStep.EXTRACT:
-        render_extract_page(state_manager)
-    elif current_step == ProcessingStep.GENERATE:
-        render_generate_page(state_manager)
-    elif current_step == ProcessingStep.DOWNLOAD:
-        render_download_page(state_manager)
-    else:
+    renderer_name = _PAGE_RENDERERS.get(current_step)
+    if renderer_name is None:
         log_error(f"Invalid step: {current_step}, resetting to upload")
         state_manager.set_current_step(ProcessingStep.UPLOAD)
         st.rerun()
+    else:
+        _lazy(renderer_name)(state_manager)
     if config.app.debug:
         _render_debug_info(state_manager)
 
@@ -173,9 +214,10 @@ def _render_debug_info(state_manager: StateManager) -> None:
         with col1:
             st.write("**Step Status:**")
             status = state_manager.get_step_status()
-            for step, completed in status.items():
-                icon = "✅" if completed else "❌"
-                st.write(f"{icon} {step.title()}: {completed}")
+            st.markdown("  \n".join(
+                f"{'✅' if completed else '❌'} {step.title()}: {completed}"
+                for step, completed in status.items()
+            ))
         
         with col2:
             st.write("**Configuration:**")
@@ -190,6 +232,7 @@ def _render_debug_info(state_manager: StateManager) -> None:
         st.write(f"Total keys: {len(session_keys)}")
         
         if st.checkbox("Show all session state"):
+            lines = []
             for key in sorted(session_keys):
                 value = st.session_state[key]
                 # Truncate long values for display
@@ -199,7 +242,8 @@ def _render_debug_info(state_manager: StateManager) -> None:
                     display_value = f"{type(value).__name__} with {len(value)} items"
                 else:
                     display_value = str(value)
-                st.code(f"{key}: {display_value}")
+                lines.append(f"{key}: {display_value}")
+            st.code("\n".join(lines), language="text")
 
 
 if __name__ == "__main__":
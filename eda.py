@@ -1,6 +1,7 @@
 # Databricks notebook source
 import pandas as pd
 import re
+from collections import defaultdict
 
 # Your nested JSON data
 data = [
@@ -40,38 +41,34 @@ data = [
     }
 ]
 
-# 1. Flatten the JSON using json_normalize
-df = pd.json_normalize(
-    data,
-    record_path=['sub_topics', 'sub_questions'],
-    meta=['question', ['sub_topics', 'topic']],
-    errors='ignore'
-)
-
-# 2. Rename columns for clarity
-df = df.rename(columns={
-    'sub_question': 'sub_question_id',
-    'text': 'question_text',
-    'sub_topics.topic': 'topic',
-    'question': 'question_id'
-})
-
-# 3. Create a single rendered question string
-df['rendered_q'] = df['sub_question_id'] + ": " + df['question_text']
+# 1. Flatten the nested JSON in one pass, rendering each question and grouping it by topic
+records = []
+topic_rows = defaultdict(list)
+question_of_topic = {}
+for q in data:
+    for t in q['sub_topics']:
+        topic = t['topic']
+        question_of_topic.setdefault(topic, q['question'])
+        for sq in t['sub_questions']:
+            rendered_q = sq['sub_question'] + ": " + sq['text']
+            records.append((sq['sub_question'], sq['text'], q['question'], topic, rendered_q))
+            topic_rows[topic].append((sq['sub_question'], rendered_q))
+
+# 2. Build the flat dataframe directly with the final column names
+df = pd.DataFrame(records, columns=['sub_question_id', 'question_text', 'question_id', 'topic', 'rendered_q'])
 df
 
 # COMMAND ----------
 
 
-# 4. Group by topic, preserving question_id and concatenating rendered questions
-grouped = (
-    df.groupby('topic', as_index=False)
-      .agg(
-          question_id=('question_id', 'first'),
-          sub_question_ids=('sub_question_id', list),
-          concatenated_questions=('rendered_q', '\n\n'.join)
-      )
-)
+# 3. Group by topic, preserving question_id and concatenating rendered questions
+topics = sorted(topic_rows)  # same ordering as groupby's sorted keys
+grouped = pd.DataFrame({
+    'topic': topics,
+    'question_id': [question_of_topic[t] for t in topics],
+    'sub_question_ids': [[sq_id for sq_id, _ in topic_rows[t]] for t in topics],
+    'concatenated_questions': ['\n\n'.join(r for _, r in topic_rows[t]) for t in topics]
+})
 
 grouped
 
@@ -79,6 +76,7 @@ grouped
 
 import pandas as pd
 import re
+from collections import defaultdict
 
 # Your nested JSON data
 data = [
@@ -97,35 +95,31 @@ data = [
     }
 ]
 
-# 1. Flatten the JSON using json_normalize
-df = pd.json_normalize(
-    data,
-    record_path=['sub_topics', 'sub_questions'],
-    meta=['question', ['sub_topics', 'topic']],
-    errors='ignore'
-)
-
-# 2. Rename columns for clarity
-df = df.rename(columns={
-    'sub_question': 'sub_question_id',
-    'text': 'question_text',
-    'sub_topics.topic': 'topic',
-    'question': 'question_id'
-})
-
-# 3. Create a single rendered question string
-df['rendered_q'] = df['sub_question_id'] + ": " + df['question_text']
+# 1. Flatten the nested JSON in one pass, rendering each question and grouping it by topic
+records = []
+topic_rows = defaultdict(list)
+question_of_topic = {}
+for q in data:
+    for t in q['sub_topics']:
+        topic = t['topic']
+        question_of_topic.setdefault(topic, q['question'])
+        for sq in t['sub_questions']:
+            rendered_q = sq['sub_question'] + ": " + sq['text']
+            records.append((sq['sub_question'], sq['text'], q['question'], topic, rendered_q))
+            topic_rows[topic].append((sq['sub_question'], rendered_q))
+
+# 2. Build the flat dataframe directly with the final column names
+df = pd.DataFrame(records, columns=['sub_question_id', 'question_text', 'question_id', 'topic', 'rendered_q'])
 df
 
-# 4. Group by topic, preserving question_id and concatenating rendered questions
-grouped = (
-    df.groupby('topic', as_index=False)
-      .agg(
-          question_id=('question_id', 'first'),
-          sub_question_ids=('sub_question_id', list),
-          concatenated_questions=('rendered_q', '\n\n'.join)
-      )
-)
+# 3. Group by topic, preserving question_id and concatenating rendered questions
+topics = sorted(topic_rows)  # same ordering as groupby's sorted keys
+grouped = pd.DataFrame({
+    'topic': topics,
+    'question_id': [question_of_topic[t] for t in topics],
+    'sub_question_ids': [[sq_id for sq_id, _ in topic_rows[t]] for t in topics],
+    'concatenated_questions': ['\n\n'.join(r for _, r in topic_rows[t]) for t in topics]
+})
 
 grouped
 # Example LLM JSON response
@@ -151,11 +145,11 @@ json_response = {
 content = json_response["choices"][0]["message"]["content"]
 
 # 2. Parse with regex: capture ID and answer text (DOTALL so answers can span lines)
-pattern = r'(\d+\.\d+):\s*(.*?)(?=\n\n\d+\.\d+:|\Z)'
-matches = re.findall(pattern, content, flags=re.DOTALL)
+_ANSWER_RE = re.compile(r'(\d+\.\d+):\s*(.*?)(?=\n\n\d+\.\d+:|\Z)', re.DOTALL)
+matches = [(m.group(1), m.group(2).strip()) for m in _ANSWER_RE.finditer(content)]
 
 # 3. Build a small answers dataframe
-answers_df = pd.DataFrame(matches, columns=['sub_question_id', 'answer']).assign(answer=lambda d: d['answer'].str.strip())
+answers_df = pd.DataFrame(matches, columns=['sub_question_id', 'answer'])
 
 # 4. Join back to the original dataframe on sub_question_id
 df_with_answers = df.merge(answers_df, on='sub_question_id', how='left')
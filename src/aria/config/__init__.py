@@ -4,7 +4,10 @@ This module provides centralized configuration management with environment varia
 loading, validation, and type safety.
 """
 
-from .config import config, AppConfig, domain_config, settings
+from typing import Any
+
+from . import config as _config_module
+from .config import AppConfig, domain_config, get_config, get_session_key
 
 # Export all constants for backward compatibility
 from .config import (
@@ -18,11 +21,13 @@ from .config import (
     QUESTION_EXTRACTION_SYSTEM_PROMPT, ANSWER_GENERATION_SYSTEM_PROMPT, DEFAULT_CUSTOM_PROMPT,
     SESSION_KEYS, ERROR_MESSAGES, SUCCESS_MESSAGES,
     CSS_CLASSES, SUPPORTED_EXTENSIONS, EXPORT_EXTENSIONS,
-    MIME_TYPES, COLUMN_MAPPINGS, AGGRID_CONFIG
+    MIME_TYPES, COLUMN_MAPPINGS, AGGRID_CONFIG,
+    ERROR_FORMATTERS, SUCCESS_FORMATTERS
 )
 
-__all__ = [
-    "config", "AppConfig", "domain_config", "settings",
+# config and settings are resolved through __getattr__
+__all__ = [  # noqa: F822
+    "config", "settings", "get_config", "AppConfig", "domain_config", "get_session_key",
     "SUPPORTED_FILE_TYPES", "MAX_FILE_SIZE_MB", "MAX_QUESTIONS_PER_BATCH",
     "AVAILABLE_CLAUDE_MODELS", "DEFAULT_QUESTION_EXTRACTION_MODEL",
     "DEFAULT_TIMEOUT_SECONDS", "MAX_RETRIES", "RETRY_WAIT_SECONDS",
@@ -32,5 +37,24 @@ __all__ = [
     "QUESTION_EXTRACTION_SYSTEM_PROMPT", "ANSWER_GENERATION_SYSTEM_PROMPT", "DEFAULT_CUSTOM_PROMPT",
     "SESSION_KEYS", "ERROR_MESSAGES", "SUCCESS_MESSAGES",
     "CSS_CLASSES", "SUPPORTED_EXTENSIONS", "EXPORT_EXTENSIONS",
-    "MIME_TYPES", "COLUMN_MAPPINGS", "AGGRID_CONFIG"
+    "MIME_TYPES", "COLUMN_MAPPINGS", "AGGRID_CONFIG",
+    "ERROR_FORMATTERS", "SUCCESS_FORMATTERS"
 ]
+
+
+# The submodule shares its name with the ``config`` instance; drop the module
+# binding (set by the imports above) so ``config`` resolves through __getattr__
+# like ``settings`` does
+del config  # noqa: F821
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``config`` and ``settings`` on first access.
+    
+    Importing the package therefore doesn't build the pydantic settings.
+    """
+    if name in ("config", "settings"):
+        instance = getattr(_config_module, name)
+        globals()[name] = instance
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
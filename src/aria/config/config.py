@@ -4,19 +4,33 @@ This module provides centralized configuration management with environment varia
 loading, validation, type safety, and domain-specific settings all in one place.
 """
 
+import logging
 import os
-from typing import Optional, Final, Any
-from pydantic import BaseModel, field_validator, Field
-from pydantic_settings import BaseSettings
-from databricks.sdk import WorkspaceClient
-from databricks.sdk.core import Config
+import re
+import sys
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Optional, Final, Any, Callable, ClassVar, Mapping, NamedTuple
+from pydantic import BaseModel, field_validator, Field, PrivateAttr
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    from databricks.sdk import WorkspaceClient
+
+logger = logging.getLogger(__name__)
+
 # Load environment variables from .env file only in local development
 # In Databricks Apps, all environment variables are provided automatically
-if not os.getenv('DATABRICKS_CLIENT_ID'):
+# The .env file lives at the project root; check it directly rather than letting
+# load_dotenv() walk every parent directory
+_DOTENV_PATH = Path(__file__).resolve().parents[3] / ".env"
+if not os.getenv('DATABRICKS_CLIENT_ID') and _DOTENV_PATH.is_file():
     # Only load .env if we're not in a Databricks Apps environment
-    load_dotenv()
+    load_dotenv(_DOTENV_PATH, override=False)
 
 
 # =============================================================================
@@ -165,8 +179,96 @@ one sentence. If a question includes options, answer by selecting an option."""
 # DOMAIN-SPECIFIC CONFIGURATION
 # =============================================================================
 
-class DomainConfig:
-    """Domain-specific configuration for the application."""
+def _interned_mapping(values: dict[str, str]) -> Mapping[str, str]:
+    """Return a read-only copy of ``values`` with interned keys and values.
+    
+    Args:
+        values: String-to-string mapping
+        
+    Returns:
+        Read-only mapping sharing string objects with the rest of the process
+    """
+    return MappingProxyType({sys.intern(key): sys.intern(value) for key, value in values.items()})
+
+
+def get_session_key(name: str) -> str:
+    """Map a session key name to the key used in ``st.session_state``.
+    
+    Names declared on SessionKeys resolve to their attribute value; other
+    names map to themselves, lowercased when given in upper case.
+    
+    Args:
+        name: Key name, e.g. ``"STEP"`` or ``"questions"``
+        
+    Returns:
+        The session state key
+    """
+    if not name.startswith("_"):
+        key = getattr(SessionKeys, name, None)
+        if isinstance(key, str):
+            return key
+    return name.lower() if name.isupper() else name
+
+
+class SessionKeys:
+    """Session state key names, exposed as attributes.
+    
+    Item access (``SESSION_KEYS["STEP"]``) is kept for backward compatibility.
+    """
+    
+    __slots__ = ()
+    
+    current_step = "current_step"
+    document_name = "document_name"
+    uploaded_file = "uploaded_file"
+    file_path = "file_path"
+    processed_file_path = "processed_file_path"
+    questions = "questions"
+    answers = "answers"
+    extraction_model = "extraction_model"
+    file_preview = "file_preview"
+    custom_extraction_prompt = "custom_extraction_prompt"
+    custom_prompt = "custom_prompt"
+    TEMP_DIR = "temp_dir"
+    STEP = "current_step"
+    RFI_NAME = "document_name"
+    UPLOADED_FILE = "uploaded_file"
+    UPLOADED_FILE_PATH = "file_path"
+    TEMP_UPLOADED_FILE_PATH = "temp_uploaded_file_path"
+    QUESTIONS = "questions"
+    OTHER_DATA = "other_data"
+    DF_INPUT = "df_input"
+    EXTRACTION_COMPLETE = "extraction_complete"
+    EXTRACTION_IN_PROGRESS = "extraction_in_progress"
+    GENERATION_IN_PROGRESS = "generation_in_progress"
+    GENERATED_ANSWERS = "generated_answers"
+    GENERATED_ANSWERS_DF = "generated_answers_df"
+    GENERATION_COMPLETE = "generation_complete"
+    SELECTED_QUESTIONS = "selected_questions"
+    EXPORT_ANSWERS_DF = "export_answers_df"
+    OUTPUT_PATH = "output_path"
+    OUTPUT_FILE_NAME = "output_file_name"
+    CURRENT_PREVIEW_FILE = "current_preview_file"
+    EXECUTION_TIME = "execution_time"
+    SELECTED_EXTRACTION_MODEL = "selected_extraction_model"
+    
+    def __getitem__(self, name: str) -> str:
+        """Return the session state key for ``name``."""
+        if name.startswith("_") or not hasattr(self, name):
+            raise KeyError(name)
+        return getattr(self, name)
+    
+    def __contains__(self, name: object) -> bool:
+        """Check whether ``name`` is a known session key name."""
+        return isinstance(name, str) and not name.startswith("_") and hasattr(self, name)
+
+
+class DomainConfig(NamedTuple):
+    """Domain-specific configuration for the application.
+    
+    Declared as a NamedTuple so the shared instance is immutable and each
+    setting is read through a C-level tuple accessor.
+    """
     
     # Domain identity
     domain_name: str = DOMAIN_NAME
@@ -176,112 +278,72 @@ class DomainConfig:
     app_title: str = APP_TITLE
     app_description: str = APP_DESCRIPTION
     
-    # File processing
-    supported_file_types: list[str] = [".csv", ".html", ".htm"]
-    supported_extensions: set[str] = {".csv", ".html", ".htm"}
+    # File processing; the tuple keeps the display order, the frozenset is for lookups
+    supported_file_types: tuple[str, ...] = (".csv", ".html", ".htm")
+    supported_extensions: frozenset[str] = frozenset(supported_file_types)
     max_file_size_mb: int = 50
     max_questions_per_batch: int = 20
     
     # Export formats
-    export_extensions: dict[str, str] = {
+    export_extensions: Mapping[str, str] = _interned_mapping({
         "csv": ".csv",
         "excel": ".xlsx",
         "json": ".json"
-    }
+    })
     
     # MIME types
-    mime_types: dict[str, str] = {
+    mime_types: Mapping[str, str] = _interned_mapping({
         ".csv": "text/csv",
         ".html": "text/html",
         ".htm": "text/html",
         ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         ".json": "application/json"
-    }
+    })
     
     # Model configuration
-    models: dict[str, str] = {
+    models: Mapping[str, str] = MappingProxyType({
         "question_extraction": QUESTION_EXTRACTION_MODEL,
         "answer_generation": ANSWER_GENERATION_MODEL
-    }
+    })
     
     # Available models for UI selection
-    available_models: dict[str, str] = {
+    available_models: Mapping[str, str] = _interned_mapping({
         "Claude 3.5 Sonnet": "databricks-claude-3-5-sonnet",
         "Claude 3 Sonnet": "databricks-claude-3-sonnet",
         "Claude 3 Haiku": "databricks-claude-3-haiku",
         "Claude 3.7 Sonnet": "databricks-claude-3-7-sonnet"
-    }
+    })
     
     default_extraction_model: str = QUESTION_EXTRACTION_MODEL
     
     # Databricks configuration
-    databricks: dict[str, str] = {
+    databricks: Mapping[str, str] = MappingProxyType({
         "host": DATABRICKS_HOST,
         "volume_path": DATABRICKS_VOLUME_PATH
-    }
+    })
     
     # API configuration
-    api: dict[str, Any] = {
-        "default_timeout_seconds": 300,
-        "max_retries": 3,
-        "retry_wait_seconds": 5,
-        "default_max_tokens": 4000,
-        "default_temperature": 0.1,
-        "batch_max_tokens": 8000
-    }
+    api_default_timeout_seconds: int = 300
+    api_max_retries: int = 3
+    api_retry_wait_seconds: int = 5
+    api_default_max_tokens: int = 4000
+    api_default_temperature: float = 0.1
+    api_batch_max_tokens: int = 8000
     
     # UI constants
-    ui_constants: dict[str, int] = {
-        "sidebar_width": 300,
-        "preview_height": 400,
-        "grid_height": 600
-    }
+    ui_sidebar_width: int = 300
+    ui_preview_height: int = 400
+    ui_grid_height: int = 600
     
     # Regex patterns
-    regex_patterns: dict[str, str] = {
-        "question_id_pattern": r"Q(\d+):",
-        "fallback_question_pattern": r"(\d+)\."
-    }
+    regex_question_id_pattern: str = r"Q(\d+):"
+    regex_fallback_question_pattern: str = r"(\d+)\."
     
     # Session state keys
-    session_keys: dict[str, str] = {
-        "current_step": "current_step",
-        "document_name": "document_name",
-        "uploaded_file": "uploaded_file",
-        "file_path": "file_path",
-        "processed_file_path": "processed_file_path",
-        "questions": "questions",
-        "answers": "answers",
-        "extraction_model": "extraction_model",
-        "file_preview": "file_preview",
-        "custom_extraction_prompt": "custom_extraction_prompt",
-        "custom_prompt": "custom_prompt",
-        "TEMP_DIR": "temp_dir",
-        "STEP": "current_step",
-        "RFI_NAME": "document_name",
-        "UPLOADED_FILE": "uploaded_file",
-        "UPLOADED_FILE_PATH": "file_path",
-        "TEMP_UPLOADED_FILE_PATH": "temp_uploaded_file_path",
-        "QUESTIONS": "questions",
-        "OTHER_DATA": "other_data",
-        "DF_INPUT": "df_input",
-        "EXTRACTION_COMPLETE": "extraction_complete",
-        "EXTRACTION_IN_PROGRESS": "extraction_in_progress",
-        "GENERATION_IN_PROGRESS": "generation_in_progress",
-        "GENERATED_ANSWERS": "generated_answers",
-        "GENERATED_ANSWERS_DF": "generated_answers_df",
-        "GENERATION_COMPLETE": "generation_complete",
-        "SELECTED_QUESTIONS": "selected_questions",
-        "EXPORT_ANSWERS_DF": "export_answers_df",
-        "OUTPUT_PATH": "output_path",
-        "OUTPUT_FILE_NAME": "output_file_name",
-        "CURRENT_PREVIEW_FILE": "current_preview_file",
-        "EXECUTION_TIME": "execution_time",
-        "SELECTED_EXTRACTION_MODEL": "selected_extraction_model"
-    }
+    session_keys: SessionKeys = SessionKeys()
     
     # Error messages
-    error_messages: dict[str, str] = {
+    error_messages: Mapping[str, str] = _interned_mapping({
         "UNSUPPORTED_FILE_TYPE": "Unsupported file type: {file_type}. Please upload a CSV or HTML file.",
         "FILE_TOO_LARGE": "File size exceeds maximum allowed size of {max_size}MB.",
         "EXTRACTION_FAILED": "Failed to extract questions from the document.",
@@ -294,10 +356,10 @@ class DomainConfig:
         "NO_ANSWERS_AVAILABLE": "No answers have been generated yet. Please complete the previous steps first.",
         "NO_FILE_UPLOADED": "No file has been uploaded yet. Please upload a file in Step 1 first.",
         "NO_QUESTIONS_AVAILABLE": "No questions have been extracted yet. Please complete Step 2 first."
-    }
+    })
     
     # Success messages
-    success_messages: dict[str, str] = {
+    success_messages: Mapping[str, str] = _interned_mapping({
         "UPLOAD_SUCCESS": "File uploaded successfully!",
         "EXTRACTION_SUCCESS": "Questions extracted successfully!",
         "QUESTIONS_EXTRACTED": "Successfully extracted {count} questions from the document!",
@@ -305,42 +367,40 @@ class DomainConfig:
         "ANSWERS_GENERATED": "Successfully generated {count} answers!",
         "DOWNLOAD_SUCCESS": "File downloaded successfully!",
         "PROCESSING_COMPLETE": "Processing completed successfully!"
-    }
+    })
     
     # CSS classes
-    css_classes: dict[str, str] = {
+    css_classes: Mapping[str, str] = _interned_mapping({
         "step_container": "step-container",
         "step_header": "step-header",
         "step_content": "step-content",
         "success_message": "success-message",
         "error_message": "error-message",
         "warning_message": "warning-message"
-    }
+    })
     
     # Column mappings for different data formats
-    column_mappings: dict[str, dict[str, str]] = {
-        "csv": {
+    column_mappings: Mapping[str, Mapping[str, str]] = MappingProxyType({
+        "csv": MappingProxyType({
             "question": "Question",
             "answer": "Answer",
             "id": "ID"
-        },
-        "excel": {
+        }),
+        "excel": MappingProxyType({
             "question": "Question",
             "answer": "Answer",
             "id": "ID"
-        }
-    }
+        })
+    })
     
     # AgGrid configuration
-    aggrid_config: dict[str, Any] = {
+    aggrid_config: Mapping[str, Any] = MappingProxyType({
         "theme": "streamlit",
         "height": 400,
         "fit_columns_on_grid_load": True,
         "selection_mode": "multiple",
         "use_checkbox": True
-    }
-    
-
+    })
     
     # System prompt for question extraction (used by AI service)
     extraction_system_prompt: str = QUESTION_EXTRACTION_SYSTEM_PROMPT
@@ -350,13 +410,47 @@ class DomainConfig:
     
     # Default custom prompt for answer generation
     default_custom_prompt: str = DEFAULT_CUSTOM_PROMPT
-    
-
 
 
 # Create domain config instance
 domain_config = DomainConfig()
 
+# Constants for backward compatibility (can be imported directly)
+SUPPORTED_FILE_TYPES: Final[tuple[str, ...]] = domain_config.supported_file_types
+MAX_FILE_SIZE_MB: Final[int] = domain_config.max_file_size_mb
+MAX_QUESTIONS_PER_BATCH: Final[int] = domain_config.max_questions_per_batch
+AVAILABLE_CLAUDE_MODELS: Final[Mapping[str, str]] = domain_config.available_models
+DEFAULT_QUESTION_EXTRACTION_MODEL: Final[str] = domain_config.default_extraction_model
+DEFAULT_TIMEOUT_SECONDS: Final[int] = domain_config.api_default_timeout_seconds
+MAX_RETRIES: Final[int] = domain_config.api_max_retries
+RETRY_WAIT_SECONDS: Final[int] = domain_config.api_retry_wait_seconds
+SIDEBAR_WIDTH: Final[int] = domain_config.ui_sidebar_width
+PREVIEW_HEIGHT: Final[int] = domain_config.ui_preview_height
+GRID_HEIGHT: Final[int] = domain_config.ui_grid_height
+DEFAULT_MAX_TOKENS: Final[int] = domain_config.api_default_max_tokens
+DEFAULT_TEMPERATURE: Final[float] = domain_config.api_default_temperature
+BATCH_MAX_TOKENS: Final[int] = domain_config.api_batch_max_tokens
+QUESTION_ID_PATTERN: Final[str] = domain_config.regex_question_id_pattern
+FALLBACK_QUESTION_PATTERN: Final[str] = domain_config.regex_fallback_question_pattern
+
+SESSION_KEYS: Final[SessionKeys] = domain_config.session_keys
+ERROR_MESSAGES: Final[Mapping[str, str]] = domain_config.error_messages
+SUCCESS_MESSAGES: Final[Mapping[str, str]] = domain_config.success_messages
+CSS_CLASSES: Final[Mapping[str, str]] = domain_config.css_classes
+SUPPORTED_EXTENSIONS: Final[frozenset[str]] = domain_config.supported_extensions
+EXPORT_EXTENSIONS: Final[Mapping[str, str]] = domain_config.export_extensions
+MIME_TYPES: Final[Mapping[str, str]] = domain_config.mime_types
+COLUMN_MAPPINGS: Final[Mapping[str, Mapping[str, str]]] = domain_config.column_mappings
+AGGRID_CONFIG: Final[Mapping[str, Any]] = domain_config.aggrid_config
+
+# Message templates as bound str.format methods, so callers skip the attribute lookup
+ERROR_FORMATTERS: Final[Mapping[str, Callable[..., str]]] = MappingProxyType(
+    {key: message.format for key, message in ERROR_MESSAGES.items()}
+)
+SUCCESS_FORMATTERS: Final[Mapping[str, Callable[..., str]]] = MappingProxyType(
+    {key: message.format for key, message in SUCCESS_MESSAGES.items()}
+)
+
 
 # =============================================================================
 # SETTINGS CLASSES WITH ENVIRONMENT VARIABLE SUPPORT
@@ -365,12 +459,13 @@ domain_config = DomainConfig()
 class DatabricksSettings(BaseSettings):
     """Databricks-specific configuration settings using unified authentication."""
     
-    host: str = Field(default=domain_config.databricks["host"], description="Databricks workspace host URL")
-    volume_path: str = Field(default=domain_config.databricks["volume_path"], description="Volume path for file storage")
+    host: str = Field(default=DATABRICKS_HOST, description="Databricks workspace host URL")
+    volume_path: str = Field(default=DATABRICKS_VOLUME_PATH, description="Volume path for file storage")
+    
+    # Endpoint URLs already built for this host, keyed by model name
+    _endpoint_urls: dict[str, str] = PrivateAttr(default_factory=dict)
     
-    class Config:
-        env_prefix = "DATABRICKS_"
-        case_sensitive = False
+    model_config = SettingsConfigDict(env_prefix="DATABRICKS_", case_sensitive=False, frozen=True)
     
     @field_validator("host")
     @classmethod
@@ -385,24 +480,31 @@ class DatabricksSettings(BaseSettings):
     
     def get_model_endpoint_url(self, model_name: str) -> str:
         """Construct the full endpoint URL for a given model name."""
-        return f"{self.host}/serving-endpoints/{model_name}/invocations"
+        url = self._endpoint_urls.get(model_name)
+        if url is None:
+            url = sys.intern(f"{self.host}/serving-endpoints/{model_name}/invocations")
+            self._endpoint_urls[model_name] = url
+        return url
 
 
 class ModelSettings(BaseSettings):
     """AI model configuration settings."""
     
     question_extraction_model: str = Field(
-        default=domain_config.models["question_extraction"],
+        default=QUESTION_EXTRACTION_MODEL,
         description="Model name for question extraction"
     )
     answer_generation_model: str = Field(
-        default=domain_config.models["answer_generation"],
+        default=ANSWER_GENERATION_MODEL,
         description="Model name for answer generation"
     )
+    max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum number of answer generation requests in flight at once"
+    )
     
-    class Config:
-        env_prefix = ""
-        case_sensitive = False
+    model_config = SettingsConfigDict(env_prefix="", case_sensitive=False, frozen=True)
 
 
 class TrackingSettings(BaseSettings):
@@ -414,9 +516,7 @@ class TrackingSettings(BaseSettings):
     )
     enabled: bool = Field(default=True, description="Enable usage tracking")
     
-    class Config:
-        env_prefix = "TRACKING_"
-        case_sensitive = False
+    model_config = SettingsConfigDict(env_prefix="TRACKING_", case_sensitive=False, frozen=True)
 
 
 class AppSettings(BaseSettings):
@@ -427,25 +527,110 @@ class AppSettings(BaseSettings):
     max_file_size_mb: int = Field(default=domain_config.max_file_size_mb, description="Maximum file upload size in MB")
     session_timeout_hours: int = Field(default=24, description="Session timeout in hours")
     
-    class Config:
-        env_prefix = "APP_"
-        case_sensitive = False
+    model_config = SettingsConfigDict(env_prefix="APP_", case_sensitive=False, frozen=True)
+
+
+# Settings factories: each settings class is validated against the environment
+# once per process and the instance is shared afterwards
+
+@lru_cache(maxsize=1)
+def get_databricks_settings() -> DatabricksSettings:
+    """Get the shared Databricks settings instance."""
+    return DatabricksSettings()
+
+
+@lru_cache(maxsize=1)
+def get_model_settings() -> ModelSettings:
+    """Get the shared model settings instance."""
+    return ModelSettings()
+
+
+@lru_cache(maxsize=1)
+def get_tracking_settings() -> TrackingSettings:
+    """Get the shared tracking settings instance."""
+    return TrackingSettings()
+
+
+@lru_cache(maxsize=1)
+def get_app_settings() -> AppSettings:
+    """Get the shared application settings instance."""
+    return AppSettings()
+
+
+@lru_cache(maxsize=1)
+def _workspace_client() -> "WorkspaceClient":
+    """Create the shared WorkspaceClient, importing the SDK on first use."""
+    from databricks.sdk import WorkspaceClient
+    return WorkspaceClient()
+
+
+# Environment variables reported by log_configuration() in debug mode
+_DEBUG_ENV_VARS: Final[tuple[str, ...]] = (
+    'DATABRICKS_HOST', 'DATABRICKS_TOKEN', 'DATABRICKS_CLIENT_ID', 'DATABRICKS_CLIENT_SECRET', 'APP_DEVELOPMENT_MODE'
+)
+# Name fragments marking an environment variable whose value must be masked
+_SECRET_RE: Final[re.Pattern[str]] = re.compile(r'TOKEN|SECRET')
 
 
 # =============================================================================
 # UNIFIED CONFIGURATION CLASS
 # =============================================================================
 
+# Cached auth headers are re-resolved after this long, so a token rejected
+# without a recognisable error body still gets replaced; well inside the
+# lifetime of a Databricks OAuth token
+_AUTH_HEADERS_TTL_SECONDS: Final[int] = 300
+
+
 class AppConfig:
     """Unified configuration class that combines all settings and constants."""
     
+    __slots__ = (
+        "databricks", "models", "tracking", "app", "domain",
+        "question_extraction_endpoint", "answer_generation_endpoint", "_auth_headers", "_auth_lock",
+    )
+    
+    # Constants kept as attributes for backward compatibility; resolved by __getattr__
+    _COMPAT_ATTRS: ClassVar[Mapping[str, Any]] = MappingProxyType({
+        "SUPPORTED_FILE_TYPES": SUPPORTED_FILE_TYPES,
+        "MAX_FILE_SIZE_MB": MAX_FILE_SIZE_MB,
+        "MAX_QUESTIONS_PER_BATCH": MAX_QUESTIONS_PER_BATCH,
+        "AVAILABLE_CLAUDE_MODELS": AVAILABLE_CLAUDE_MODELS,
+        "DEFAULT_QUESTION_EXTRACTION_MODEL": DEFAULT_QUESTION_EXTRACTION_MODEL,
+        "DEFAULT_TIMEOUT_SECONDS": DEFAULT_TIMEOUT_SECONDS,
+        "MAX_RETRIES": MAX_RETRIES,
+        "RETRY_WAIT_SECONDS": RETRY_WAIT_SECONDS,
+        "SIDEBAR_WIDTH": SIDEBAR_WIDTH,
+        "PREVIEW_HEIGHT": PREVIEW_HEIGHT,
+        "GRID_HEIGHT": GRID_HEIGHT,
+        "DEFAULT_MAX_TOKENS": DEFAULT_MAX_TOKENS,
+        "DEFAULT_TEMPERATURE": DEFAULT_TEMPERATURE,
+        "BATCH_MAX_TOKENS": BATCH_MAX_TOKENS,
+        "QUESTION_ID_PATTERN": QUESTION_ID_PATTERN,
+        "FALLBACK_QUESTION_PATTERN": FALLBACK_QUESTION_PATTERN,
+        "EXTRACTION_SYSTEM_PROMPT": QUESTION_EXTRACTION_SYSTEM_PROMPT,
+        "GENERATION_SYSTEM_PROMPT": ANSWER_GENERATION_SYSTEM_PROMPT,
+        "DEFAULT_CUSTOM_PROMPT": DEFAULT_CUSTOM_PROMPT,
+        "SESSION_KEYS": SESSION_KEYS,
+        "ERROR_MESSAGES": ERROR_MESSAGES,
+        "SUCCESS_MESSAGES": SUCCESS_MESSAGES,
+        "CSS_CLASSES": CSS_CLASSES,
+        "SUPPORTED_EXTENSIONS": SUPPORTED_EXTENSIONS,
+        "EXPORT_EXTENSIONS": EXPORT_EXTENSIONS,
+        "MIME_TYPES": MIME_TYPES,
+        "COLUMN_MAPPINGS": COLUMN_MAPPINGS,
+        "AGGRID_CONFIG": AGGRID_CONFIG,
+        "ERROR_FORMATTERS": ERROR_FORMATTERS,
+        "SUCCESS_FORMATTERS": SUCCESS_FORMATTERS
+    })
+    
     def __init__(self):
         """Initialize all configuration sections."""
         # Settings with environment variable support
-        self.databricks = DatabricksSettings()
-        self.models = ModelSettings()
-        self.tracking = TrackingSettings()
-        self.app = AppSettings()
+        self.databricks = get_databricks_settings()
+        self.models = get_model_settings()
+        self.tracking = get_tracking_settings()
+        self.app = get_app_settings()
         
         # Domain-specific constants (read-only)
         self.domain = domain_config
@@ -457,179 +642,74 @@ class AppConfig:
         self.answer_generation_endpoint = self.databricks.get_model_endpoint_url(
             self.models.answer_generation_model
         )
+        
+        # (headers, resolved_at) pair, populated on first use, re-resolved after
+        # _AUTH_HEADERS_TTL_SECONDS and reset by refresh_auth()
+        self._auth_headers: Optional[tuple[dict[str, str], float]] = None
+        self._auth_lock = threading.Lock()
     
-    # =============================================================================
-    # CONSTANTS (for backward compatibility)
-    # =============================================================================
-    
-    @property
-    def SUPPORTED_FILE_TYPES(self) -> list[str]:
-        """Supported file types."""
-        return domain_config.supported_file_types
-    
-    @property
-    def MAX_FILE_SIZE_MB(self) -> int:
-        """Maximum file size in MB."""
-        return domain_config.max_file_size_mb
-    
-    @property
-    def MAX_QUESTIONS_PER_BATCH(self) -> int:
-        """Maximum questions per batch."""
-        return domain_config.max_questions_per_batch
-    
-    @property
-    def AVAILABLE_CLAUDE_MODELS(self) -> dict[str, str]:
-        """Available Claude models."""
-        return domain_config.available_models
-    
-    @property
-    def DEFAULT_QUESTION_EXTRACTION_MODEL(self) -> str:
-        """Default question extraction model."""
-        return domain_config.default_extraction_model
-    
-    @property
-    def DEFAULT_TIMEOUT_SECONDS(self) -> int:
-        """Default timeout in seconds."""
-        return domain_config.api["default_timeout_seconds"]
-    
-    @property
-    def MAX_RETRIES(self) -> int:
-        """Maximum retries."""
-        return domain_config.api["max_retries"]
-    
-    @property
-    def RETRY_WAIT_SECONDS(self) -> int:
-        """Retry wait seconds."""
-        return domain_config.api["retry_wait_seconds"]
-    
-    @property
-    def SIDEBAR_WIDTH(self) -> int:
-        """Sidebar width."""
-        return domain_config.ui_constants["sidebar_width"]
-    
-    @property
-    def PREVIEW_HEIGHT(self) -> int:
-        """Preview height."""
-        return domain_config.ui_constants["preview_height"]
-    
-    @property
-    def GRID_HEIGHT(self) -> int:
-        """Grid height."""
-        return domain_config.ui_constants["grid_height"]
-    
-    @property
-    def DEFAULT_MAX_TOKENS(self) -> int:
-        """Default max tokens."""
-        return domain_config.api["default_max_tokens"]
-    
-    @property
-    def DEFAULT_TEMPERATURE(self) -> float:
-        """Default temperature."""
-        return domain_config.api["default_temperature"]
-    
-    @property
-    def BATCH_MAX_TOKENS(self) -> int:
-        """Batch max tokens."""
-        return domain_config.api["batch_max_tokens"]
-    
-    @property
-    def QUESTION_ID_PATTERN(self) -> str:
-        """Question ID pattern."""
-        return domain_config.regex_patterns["question_id_pattern"]
-    
-    @property
-    def FALLBACK_QUESTION_PATTERN(self) -> str:
-        """Fallback question pattern."""
-        return domain_config.regex_patterns["fallback_question_pattern"]
-    
-
-    
-    @property
-    def EXTRACTION_SYSTEM_PROMPT(self) -> str:
-        """System prompt for question extraction."""
-        return domain_config.extraction_system_prompt
-    
-    @property
-    def GENERATION_SYSTEM_PROMPT(self) -> str:
-        """System prompt for answer generation."""
-        return domain_config.generation_system_prompt
-    
-    @property
-    def DEFAULT_CUSTOM_PROMPT(self) -> str:
-        """Default custom prompt for answer generation."""
-        return domain_config.default_custom_prompt
-    
-    @property
-    def SESSION_KEYS(self) -> dict[str, str]:
-        """Session keys."""
-        return domain_config.session_keys
-    
-    @property
-    def ERROR_MESSAGES(self) -> dict[str, str]:
-        """Error messages."""
-        return domain_config.error_messages
-    
-    @property
-    def SUCCESS_MESSAGES(self) -> dict[str, str]:
-        """Success messages."""
-        return domain_config.success_messages
-    
-    @property
-    def CSS_CLASSES(self) -> dict[str, str]:
-        """CSS classes."""
-        return domain_config.css_classes
-    
-    @property
-    def SUPPORTED_EXTENSIONS(self) -> set[str]:
-        """Supported extensions."""
-        return domain_config.supported_extensions
-    
-    @property
-    def EXPORT_EXTENSIONS(self) -> dict[str, str]:
-        """Export extensions."""
-        return domain_config.export_extensions
-    
-    @property
-    def MIME_TYPES(self) -> dict[str, str]:
-        """MIME types."""
-        return domain_config.mime_types
-    
-    @property
-    def COLUMN_MAPPINGS(self) -> dict[str, dict[str, str]]:
-        """Column mappings."""
-        return domain_config.column_mappings
-    
-    @property
-    def AGGRID_CONFIG(self) -> dict[str, Any]:
-        """AgGrid configuration."""
-        return domain_config.aggrid_config
+    def __getattr__(self, name: str) -> Any:
+        """Resolve the backward-compatible uppercase constants."""
+        try:
+            return AppConfig._COMPAT_ATTRS[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}") from None
     
     # =============================================================================
     # DATABRICKS INTEGRATION
     # =============================================================================
     
-    def get_workspace_client(self) -> Optional[WorkspaceClient]:
+    def get_workspace_client(self) -> Optional["WorkspaceClient"]:
         """Create a Databricks WorkspaceClient using unified authentication.
         
         The SDK automatically detects the best authentication method from environment variables.
+        The client is created once and reused; the SDK refreshes credentials itself.
         
         Returns:
             WorkspaceClient instance or None if configuration fails
         """
         try:
-            # Simply create the client - SDK handles all authentication automatically
-            client = WorkspaceClient()
-            return client
+            # SDK handles all authentication automatically
+            return _workspace_client()
         except Exception as e:
-            print(f"[Config Error] Failed to create WorkspaceClient: {e}")
+            logger.error("Failed to create WorkspaceClient: %s", e)
             return None
     
     def get_auth_headers(self) -> Optional[dict[str, str]]:
         """Get authentication headers for direct API calls.
         
+        The headers are resolved through the SDK and reused for up to
+        _AUTH_HEADERS_TTL_SECONDS; call refresh_auth() when the token is rejected.
+        
         Returns:
             Dictionary with authorization headers or None if not available
         """
+        cached = self._auth_headers
+        if cached is not None and time.monotonic() - cached[1] < _AUTH_HEADERS_TTL_SECONDS:
+            return dict(cached[0])
+        
+        with self._auth_lock:
+            # Another thread may have resolved the headers while we waited
+            cached = self._auth_headers
+            if cached is not None and time.monotonic() - cached[1] < _AUTH_HEADERS_TTL_SECONDS:
+                return dict(cached[0])
+            
+            headers = self._resolve_auth_headers()
+            self._auth_headers = (headers, time.monotonic()) if headers else None
+            return dict(headers) if headers else None
+    
+    def refresh_auth(self) -> Optional[dict[str, str]]:
+        """Discard the cached authentication headers and resolve them again.
+        
+        Returns:
+            Dictionary with fresh authorization headers or None if not available
+        """
+        with self._auth_lock:
+            self._auth_headers = None
+        return self.get_auth_headers()
+    
+    def _resolve_auth_headers(self) -> Optional[dict[str, str]]:
+        """Ask the SDK for authorization headers."""
         try:
             workspace_client = self.get_workspace_client()
             if workspace_client is None:
@@ -695,13 +775,18 @@ class AppConfig:
             if not self.databricks.host:
                 critical_errors.append("DATABRICKS_HOST is required")
             
-            # Everything else becomes a warning in dev mode
-            try:
-                test_client = self.get_workspace_client()
-                if test_client is None:
-                    warnings.append("No authentication configured - API calls will fail")
-            except Exception:
-                warnings.append("Authentication configuration issue - API calls may fail")
+            # Everything else becomes a warning in dev mode; skip building the
+            # SDK client when no credentials are present in the environment
+            env = os.environ
+            if not (env.get('DATABRICKS_TOKEN') or env.get('DATABRICKS_CLIENT_ID')):
+                warnings.append("No authentication configured - API calls will fail")
+            else:
+                try:
+                    test_client = self.get_workspace_client()
+                    if test_client is None:
+                        warnings.append("No authentication configured - API calls will fail")
+                except Exception:
+                    warnings.append("Authentication configuration issue - API calls may fail")
                 
         else:
             # Normal validation for production
@@ -731,33 +816,44 @@ class AppConfig:
     
     def log_configuration(self) -> None:
         """Log current configuration (without sensitive data)."""
-        print(f"[Config] Domain: {domain_config.domain_name} - {domain_config.domain_description}")
-        print(f"[Config] Databricks Host: {self.databricks.host}")
+        env = os.environ
         
         # Determine auth mode from environment variables
         auth_mode = "Unknown"
-        if os.getenv('DATABRICKS_CLIENT_ID'):
+        if env.get('DATABRICKS_CLIENT_ID'):
             auth_mode = "Service Principal"
-        elif os.getenv('DATABRICKS_TOKEN'):
+        elif env.get('DATABRICKS_TOKEN'):
             auth_mode = "Personal Access Token"
         
-        print(f"[Config] Auth Mode: {auth_mode}")
-        print(f"[Config] Question Extraction Model: {self.models.question_extraction_model}")
-        print(f"[Config] Answer Generation Model: {self.models.answer_generation_model}")
-        print(f"[Config] Debug Mode: {self.app.debug}")
-        print(f"[Config] Development Mode: {self.app.development_mode}")
+        # One record for the summary; arguments are only formatted if INFO is enabled
+        logger.info(
+            "Domain: %s - %s\n"
+            "Databricks Host: %s\n"
+            "Auth Mode: %s\n"
+            "Question Extraction Model: %s\n"
+            "Answer Generation Model: %s\n"
+            "Debug Mode: %s\n"
+            "Development Mode: %s",
+            domain_config.domain_name, domain_config.domain_description,
+            self.databricks.host,
+            auth_mode,
+            self.models.question_extraction_model,
+            self.models.answer_generation_model,
+            self.app.debug,
+            self.app.development_mode,
+        )
         
         # Additional debug info for authentication troubleshooting
-        if self.app.debug:
-            print(f"[Config Debug] Environment Variables Present:")
-            env_vars = ['DATABRICKS_HOST', 'DATABRICKS_TOKEN', 'DATABRICKS_CLIENT_ID', 'DATABRICKS_CLIENT_SECRET', 'APP_DEVELOPMENT_MODE']
-            for var in env_vars:
-                value = os.getenv(var)
+        if self.app.debug and logger.isEnabledFor(logging.INFO):
+            lines = ["Environment Variables Present:"]
+            for var in _DEBUG_ENV_VARS:
+                value = env.get(var)
                 if value:
-                    display_value = "***" if any(secret in var for secret in ['TOKEN', 'SECRET']) else value
-                    print(f"[Config Debug]   {var}: {display_value}")
+                    display_value = "***" if _SECRET_RE.search(var) else value
+                    lines.append(f"  {var}: {display_value}")
                 else:
-                    print(f"[Config Debug]   {var}: Not Set")
+                    lines.append(f"  {var}: Not Set")
+            logger.info("%s", "\n".join(lines))
         
         is_valid, issues = self.validate_configuration()
         if issues:
@@ -772,53 +868,52 @@ class AppConfig:
                     critical_errors.append(issue)
             
             if critical_errors:
-                print("[Config Errors]:")
-                for error in critical_errors:
-                    print(f"  - {error}")
+                logger.error("Configuration errors:\n  - %s", "\n  - ".join(critical_errors))
             
             if warnings:
-                print("[Config Warnings]:")
-                for warning in warnings:
-                    print(f"  - {warning}")
+                logger.warning("Configuration warnings:\n  - %s", "\n  - ".join(warnings))
 
 
 # =============================================================================
 # SINGLETON INSTANCES
 # =============================================================================
 
-# Create unified config instance
-config = AppConfig()
-
-# Create backward compatibility aliases
-settings = config  # For code that imports 'settings'
-
-# Constants for backward compatibility (can be imported directly)
-SUPPORTED_FILE_TYPES: Final[list[str]] = config.SUPPORTED_FILE_TYPES
-MAX_FILE_SIZE_MB: Final[int] = config.MAX_FILE_SIZE_MB
-MAX_QUESTIONS_PER_BATCH: Final[int] = config.MAX_QUESTIONS_PER_BATCH
-AVAILABLE_CLAUDE_MODELS: Final[dict[str, str]] = config.AVAILABLE_CLAUDE_MODELS
-DEFAULT_QUESTION_EXTRACTION_MODEL: Final[str] = config.DEFAULT_QUESTION_EXTRACTION_MODEL
-DEFAULT_TIMEOUT_SECONDS: Final[int] = config.DEFAULT_TIMEOUT_SECONDS
-MAX_RETRIES: Final[int] = config.MAX_RETRIES
-RETRY_WAIT_SECONDS: Final[int] = config.RETRY_WAIT_SECONDS
-SIDEBAR_WIDTH: Final[int] = config.SIDEBAR_WIDTH
-PREVIEW_HEIGHT: Final[int] = config.PREVIEW_HEIGHT
-GRID_HEIGHT: Final[int] = config.GRID_HEIGHT
-DEFAULT_MAX_TOKENS: Final[int] = config.DEFAULT_MAX_TOKENS
-DEFAULT_TEMPERATURE: Final[float] = config.DEFAULT_TEMPERATURE
-BATCH_MAX_TOKENS: Final[int] = config.BATCH_MAX_TOKENS
-QUESTION_ID_PATTERN: Final[str] = config.QUESTION_ID_PATTERN
-FALLBACK_QUESTION_PATTERN: Final[str] = config.FALLBACK_QUESTION_PATTERN
-
-# EXTRACTION_SYSTEM_PROMPT: Final[str] = config.EXTRACTION_SYSTEM_PROMPT
-# GENERATION_SYSTEM_PROMPT: Final[str] = config.GENERATION_SYSTEM_PROMPT
-# DEFAULT_CUSTOM_PROMPT: Final[str] = config.DEFAULT_CUSTOM_PROMPT
-SESSION_KEYS: Final[dict[str, str]] = config.SESSION_KEYS
-ERROR_MESSAGES: Final[dict[str, str]] = config.ERROR_MESSAGES
-SUCCESS_MESSAGES: Final[dict[str, str]] = config.SUCCESS_MESSAGES
-CSS_CLASSES: Final[dict[str, str]] = config.CSS_CLASSES
-SUPPORTED_EXTENSIONS: Final[set[str]] = config.SUPPORTED_EXTENSIONS
-EXPORT_EXTENSIONS: Final[dict[str, str]] = config.EXPORT_EXTENSIONS
-MIME_TYPES: Final[dict[str, str]] = config.MIME_TYPES
-COLUMN_MAPPINGS: Final[dict[str, dict[str, str]]] = config.COLUMN_MAPPINGS
-AGGRID_CONFIG: Final[dict[str, Any]] = config.AGGRID_CONFIG 
\ No newline at end of file
+# Public names; ``config`` and ``settings`` resolve lazily through __getattr__
+__all__ = [  # noqa: F822
+    "config", "settings", "get_config", "AppConfig", "domain_config", "get_session_key",
+    "SUPPORTED_FILE_TYPES", "MAX_FILE_SIZE_MB", "MAX_QUESTIONS_PER_BATCH",
+    "AVAILABLE_CLAUDE_MODELS", "DEFAULT_QUESTION_EXTRACTION_MODEL",
+    "DEFAULT_TIMEOUT_SECONDS", "MAX_RETRIES", "RETRY_WAIT_SECONDS",
+    "SIDEBAR_WIDTH", "PREVIEW_HEIGHT", "GRID_HEIGHT",
+    "DEFAULT_MAX_TOKENS", "DEFAULT_TEMPERATURE", "BATCH_MAX_TOKENS",
+    "QUESTION_ID_PATTERN", "FALLBACK_QUESTION_PATTERN",
+    "QUESTION_EXTRACTION_SYSTEM_PROMPT", "ANSWER_GENERATION_SYSTEM_PROMPT", "DEFAULT_CUSTOM_PROMPT",
+    "SESSION_KEYS", "ERROR_MESSAGES", "SUCCESS_MESSAGES",
+    "CSS_CLASSES", "SUPPORTED_EXTENSIONS", "EXPORT_EXTENSIONS",
+    "MIME_TYPES", "COLUMN_MAPPINGS", "AGGRID_CONFIG",
+    "ERROR_FORMATTERS", "SUCCESS_FORMATTERS"
+]
+
+
+@lru_cache(maxsize=1)
+def get_config() -> AppConfig:
+    """Get the unified config instance, creating it on first use.
+    
+    Returns:
+        Shared AppConfig instance
+    """
+    return AppConfig()
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``config`` and its ``settings`` alias lazily on first access.
+    
+    The resolved instance is written back into module globals so later
+    lookups are plain attribute reads.
+    """
+    if name in ("config", "settings"):
+        instance = get_config()
+        globals()["config"] = instance
+        globals()["settings"] = instance  # For code that imports 'settings'
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,9 +4,12 @@ This module contains core utilities including exceptions, logging configuration,
 and type definitions.
 """
 
+from typing import Any
+
 from .exceptions import *
 from .logging_config import setup_logging, get_logger, log_info, log_warning, log_error, log_success
 from .types import *
+from . import types as _types_module
 
 __all__ = [
     # Exceptions
@@ -49,3 +52,10 @@ __all__ = [
     "SessionState",
     "ConfigDict",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Forward lazily resolved type aliases to the types module."""
+    if name == "DataFrameType":
+        return getattr(_types_module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,7 +4,13 @@ This module defines custom exception classes to provide better error handling
 and more informative error messages throughout the application.
 """
 
-from typing import Optional, Any
+from functools import cached_property
+from types import MappingProxyType
+from typing import Optional, Any, Mapping
+
+
+# Shared read-only default for exceptions raised without details
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
 
 
 class AriaBaseException(Exception):
@@ -15,18 +21,33 @@ class AriaBaseException(Exception):
         
         Args:
             message: Human-readable error message
-            details: Optional dictionary with additional error context
+            details: Optional dictionary with additional error context.
+                Treated as read-only; callers must not mutate ``.details``.
         """
         super().__init__(message)
         self.message = message
-        self.details = details or {}
+        self.details = details if details else _EMPTY_DETAILS
     
-    def __str__(self) -> str:
-        """Return a string representation of the exception."""
-        if self.details:
-            details_str = ", ".join(f"{k}={v}" for k, v in self.details.items())
+    def _detail_pairs(self) -> list[tuple[str, Any]]:
+        """Return the key/value pairs rendered after the message.
+        
+        Formatting is deferred to ``__str__`` so exceptions that are caught
+        and never logged do not pay for it.
+        """
+        return list(self.details.items())
+    
+    @cached_property
+    def _rendered(self) -> str:
+        """Render the message once; details are read-only so it never goes stale."""
+        pairs = self._detail_pairs()
+        if pairs:
+            details_str = ", ".join([f"{k}={v}" for k, v in pairs])
             return f"{self.message} ({details_str})"
         return self.message
+    
+    def __str__(self) -> str:
+        """Return a string representation of the exception."""
+        return self._rendered
 
 
 class ConfigurationError(AriaBaseException):
@@ -77,15 +98,18 @@ class DatabricksAPIError(AriaBaseException):
             response_text: Response body text
             details: Additional error context
         """
-        api_details = details or {}
-        if status_code:
-            api_details["status_code"] = status_code
-        if response_text:
-            api_details["response_text"] = response_text[:200]  # Truncate long responses
-            
-        super().__init__(message, api_details)
+        super().__init__(message, details)
         self.status_code = status_code
         self.response_text = response_text
+    
+    def _detail_pairs(self) -> list[tuple[str, Any]]:
+        """Return the key/value pairs, including the API status and response."""
+        pairs = list(self.details.items())
+        if self.status_code:
+            pairs.append(("status_code", self.status_code))
+        if self.response_text:
+            pairs.append(("response_text", self.response_text[:200]))  # Truncate long responses
+        return pairs
 
 
 class ModelInvocationError(DatabricksAPIError):
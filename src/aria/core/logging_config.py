@@ -4,12 +4,54 @@ This module provides centralized logging setup with both console and UI logging
 capabilities, following best practices for structured logging.
 """
 
+import atexit
 import logging
+import queue
 import sys
+import threading
+from bisect import bisect_right
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 from pathlib import Path
 import streamlit as st
 
+# Application logger used by the convenience wrappers; setup_logging()
+# configures this same instance in place
+_LOGGER = logging.getLogger("aria")
+
+# Background listener that writes console/file output off the calling thread
+_queue_listener: Optional[QueueListener] = None
+_queue_listener_lock = threading.Lock()
+
+# Arguments of the current setup_logging() configuration; repeated calls with
+# the same arguments (every Streamlit rerun) keep the running listener
+_configured_with: Optional[tuple] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the background log listener, closing its handlers."""
+    global _queue_listener, _configured_with
+    _configured_with = None
+    if _queue_listener is None:
+        return
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.close()
+    _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+# UI display per level band: below INFO, INFO, WARNING, ERROR and above
+_UI_LEVELS = (logging.INFO, logging.WARNING, logging.ERROR)
+_UI_DISPATCH = (
+    (st.text, "🔧"),
+    (st.info, "📋"),
+    (st.warning, "⚠️"),
+    (st.error, "❌"),
+)
+
 
 class StreamlitHandler(logging.Handler):
     """Custom logging handler that can display messages in Streamlit UI."""
@@ -23,6 +65,19 @@ class StreamlitHandler(logging.Handler):
         super().__init__()
         self.display_in_ui = display_in_ui
     
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Skip filtering and locking entirely when UI display is off.
+        
+        Args:
+            record: The log record to handle
+            
+        Returns:
+            Whether the record was emitted
+        """
+        if not self.display_in_ui:
+            return False
+        return super().handle(record)
+    
     def emit(self, record: logging.LogRecord) -> None:
         """Emit a log record to Streamlit UI if configured to do so.
         
@@ -31,18 +86,40 @@ class StreamlitHandler(logging.Handler):
         """
         if not self.display_in_ui:
             return
-            
-        msg = self.format(record)
         
         # Display in Streamlit UI based on log level
-        if record.levelno >= logging.ERROR:
-            st.error(f"❌ {msg}")
-        elif record.levelno >= logging.WARNING:
-            st.warning(f"⚠️ {msg}")
-        elif record.levelno >= logging.INFO:
-            st.info(f"📋 {msg}")
-        else:  # DEBUG and below
-            st.text(f"🔧 {msg}")
+        display_fn, prefix = _UI_DISPATCH[bisect_right(_UI_LEVELS, record.levelno)]
+        display_fn(f"{prefix} {self.format(record)}")
+
+
+class _FastFormatter(logging.Formatter):
+    """Console/file formatter that builds the line with an f-string.
+    
+    Produces the same output as
+    ``'%(asctime)s - %(name)s - %(levelname)s - %(message)s'`` without going
+    through %-style templating for every record.
+    """
+    
+    default_time_format = '%Y-%m-%d %H:%M:%S'
+    default_msec_format = None
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a log record.
+        
+        Args:
+            record: The log record to format
+            
+        Returns:
+            Formatted log line, followed by any exception or stack text
+        """
+        line = f"{self.formatTime(record)} - {record.name} - {record.levelname} - {record.getMessage()}"
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            line = f"{line}\n{record.exc_text}"
+        if record.stack_info:
+            line = f"{line}\n{self.formatStack(record.stack_info)}"
+        return line
 
 
 def setup_logging(
@@ -60,24 +137,53 @@ def setup_logging(
     Returns:
         Configured logger instance
     """
+    global _configured_with
+    
     # Create logger
     logger = logging.getLogger("aria")
-    logger.setLevel(getattr(logging, level.upper(), logging.INFO))
+    requested = (level.upper(), log_file, display_in_ui)
+    
+    with _queue_listener_lock:
+        # Already configured this way: keep the running listener thread
+        if requested == _configured_with:
+            return logger
+        
+        logger.setLevel(getattr(logging, level.upper(), logging.INFO))
+        
+        # Clear any existing handlers and stop the previous listener
+        logger.handlers.clear()
+        _stop_queue_listener()
+        _configure_handlers(logger, log_file, display_in_ui)
+        _configured_with = requested
+    
+    # Prevent propagation to root logger
+    logger.propagate = False
+    
+    return logger
+
+
+def _configure_handlers(
+    logger: logging.Logger,
+    log_file: Optional[Path],
+    display_in_ui: bool
+) -> None:
+    """Attach the console/file handlers (via a queue) and the UI handler.
     
-    # Clear any existing handlers
-    logger.handlers.clear()
+    Args:
+        logger: Logger to configure
+        log_file: Optional file path for logging output
+        display_in_ui: Whether to display logs in Streamlit UI
+    """
+    global _queue_listener
     
     # Create formatter
-    formatter = logging.Formatter(
-        fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    formatter = _FastFormatter()
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.DEBUG)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    output_handlers = [console_handler]
     
     # File handler (if specified)
     if log_file:
@@ -85,7 +191,13 @@ def setup_logging(
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        output_handlers.append(file_handler)
+    
+    # Console and file writes happen on the listener thread; callers only enqueue
+    log_queue = queue.SimpleQueue()
+    _queue_listener = QueueListener(log_queue, *output_handlers, respect_handler_level=True)
+    _queue_listener.start()
+    logger.addHandler(QueueHandler(log_queue))
     
     # Streamlit UI handler (if requested)
     if display_in_ui:
@@ -93,11 +205,6 @@ def setup_logging(
         ui_handler.setLevel(logging.INFO)
         ui_handler.setFormatter(logging.Formatter('%(message)s'))
         logger.addHandler(ui_handler)
-    
-    # Prevent propagation to root logger
-    logger.propagate = False
-    
-    return logger
 
 
 def log_api_call(
@@ -113,27 +220,25 @@ def log_api_call(
     Args:
         logger: Logger instance to use
         endpoint: API endpoint that was called
-        payload: Request payload (sensitive data will be sanitized)
+        payload: Request payload (not logged; kept for call-site compatibility)
         status_code: HTTP status code of the response
         response: Response data (optional)
         error: Exception that occurred (optional)
     """
-    # Sanitize payload (remove auth tokens)
-    sanitized_payload = payload.copy() if isinstance(payload, dict) else {}
-    if 'messages' in sanitized_payload:
-        # Keep the messages but sanitize any auth info
-        pass
+    failed = error or (status_code and status_code >= 400)
+    if not logger.isEnabledFor(logging.ERROR if failed else logging.INFO):
+        return
     
     # Extract endpoint name for logging
-    endpoint_short = endpoint.split('/')[-1] if isinstance(endpoint, str) else 'unknown'
+    endpoint_short = endpoint.rpartition('/')[2] if isinstance(endpoint, str) else 'unknown'
     
     # Log based on success/failure
     if error:
-        logger.error(f"API call failed to {endpoint_short}: {error}")
-    elif status_code and status_code >= 400:
-        logger.error(f"API call failed to {endpoint_short} with status {status_code}")
+        logger.error("API call failed to %s: %s", endpoint_short, error)
+    elif failed:
+        logger.error("API call failed to %s with status %s", endpoint_short, status_code)
     else:
-        logger.info(f"API call successful to {endpoint_short} with status {status_code}")
+        logger.info("API call successful to %s with status %s", endpoint_short, status_code)
 
 
 def get_logger(name: str = "aria") -> logging.Logger:
@@ -148,19 +253,40 @@ def get_logger(name: str = "aria") -> logging.Logger:
     return logging.getLogger(name)
 
 
-# Convenience functions for common logging patterns
-def log_info(message: str, display_in_ui: bool = False) -> None:
-    """Log an info message.
+# Convenience functions for common logging patterns: level, log format,
+# Streamlit display function and UI prefix for each kind of message
+_LOG_KINDS = {
+    "info": (logging.INFO, "%s", st.info, "📋"),
+    "warning": (logging.WARNING, "%s", st.warning, "⚠️"),
+    "error": (logging.ERROR, "%s", st.error, "❌"),
+    "success": (logging.INFO, "SUCCESS: %s", st.success, "✅"),
+}
+
+
+def _log(kind: str, message: str, display_in_ui: bool) -> None:
+    """Log a message of the given kind and optionally show it in the UI.
     
     Args:
+        kind: Key into ``_LOG_KINDS``
         message: Message to log
         display_in_ui: Whether to display in Streamlit UI
     """
-    logger = get_logger()
-    logger.info(message)
+    level, log_format, display_fn, prefix = _LOG_KINDS[kind]
+    if _LOGGER.isEnabledFor(level):
+        _LOGGER.log(level, log_format, message)
     
     if display_in_ui:
-        st.info(f"📋 {message}")
+        display_fn(f"{prefix} {message}")
+
+
+def log_info(message: str, display_in_ui: bool = False) -> None:
+    """Log an info message.
+    
+    Args:
+        message: Message to log
+        display_in_ui: Whether to display in Streamlit UI
+    """
+    _log("info", message, display_in_ui)
 
 
 def log_warning(message: str, display_in_ui: bool = False) -> None:
@@ -170,11 +296,7 @@ def log_warning(message: str, display_in_ui: bool = False) -> None:
         message: Message to log
         display_in_ui: Whether to display in Streamlit UI
     """
-    logger = get_logger()
-    logger.warning(message)
-    
-    if display_in_ui:
-        st.warning(f"⚠️ {message}")
+    _log("warning", message, display_in_ui)
 
 
 def log_error(message: str, display_in_ui: bool = False) -> None:
@@ -184,11 +306,7 @@ def log_error(message: str, display_in_ui: bool = False) -> None:
         message: Message to log
         display_in_ui: Whether to display in Streamlit UI
     """
-    logger = get_logger()
-    logger.error(message)
-    
-    if display_in_ui:
-        st.error(f"❌ {message}")
+    _log("error", message, display_in_ui)
 
 
 def log_success(message: str, display_in_ui: bool = False) -> None:
@@ -198,8 +316,4 @@ def log_success(message: str, display_in_ui: bool = False) -> None:
         message: Message to log
         display_in_ui: Whether to display in Streamlit UI
     """
-    logger = get_logger()
-    logger.info(f"SUCCESS: {message}")
-    
-    if display_in_ui:
-        st.success(f"✅ {message}") 
\ No newline at end of file
+    _log("success", message, display_in_ui)
@@ -4,11 +4,37 @@ This module contains Pydantic models and type definitions used throughout
 the application for data validation and type safety.
 """
 
-from typing import Optional, List, Dict, Any, Union
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Union, Annotated, Callable, Literal
+import sys
+import time
+from operator import itemgetter
 from enum import Enum
-from datetime import datetime
-from pydantic import BaseModel, Field, validator
-import pandas as pd
+from datetime import datetime, timezone
+from pydantic import AfterValidator, BaseModel, Field, StringConstraints, TypeAdapter, ValidationError
+from pydantic import ConfigDict as ModelConfig
+
+from aria.core.exceptions import QuestionExtractionError
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Field constraints are checked by pydantic-core instead of Python validators
+MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB in bytes
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+# Values that repeat across every row of a document share one string object
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+
+def ns_to_datetime(timestamp_ns: int) -> datetime:
+    """Convert a ``time.time_ns()`` timestamp to a UTC datetime.
+    
+    Args:
+        timestamp_ns: Nanoseconds since the epoch
+        
+    Returns:
+        Timezone-aware datetime in UTC
+    """
+    return datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc)
 
 
 class FileType(str, Enum):
@@ -32,68 +58,120 @@ class AuthMode(str, Enum):
     SERVICE_PRINCIPAL = "service_principal"
 
 
+# Literal forms of the enums above, used as field annotations so pydantic-core
+# validates them with a single lookup; the enum classes remain the public API
+FileTypeValue = Literal["csv", "html", "htm"]
+ProcessingStepValue = Literal[1, 2, 3, 4]
+
+
 class UploadedFile(BaseModel):
     """Model representing an uploaded file."""
     
+    model_config = ModelConfig(frozen=True)
+    
     name: str = Field(..., description="Original filename")
-    size: int = Field(..., description="File size in bytes")
-    type: FileType = Field(..., description="File type")
+    size: int = Field(..., le=MAX_FILE_SIZE, description="File size in bytes")
+    type: FileTypeValue = Field(..., description="File type")
     path: str = Field(..., description="Local file path")
     mime_type: str = Field(..., description="MIME type of the file")
     
-    @validator("size")
-    def validate_file_size(cls, v: int) -> int:
-        """Validate file size is within limits."""
-        max_size = 50 * 1024 * 1024  # 50MB in bytes
-        if v > max_size:
-            raise ValueError(f"File size {v} exceeds maximum allowed size of {max_size} bytes")
-        return v
+    @property
+    def file_type_enum(self) -> FileType:
+        """File type as a FileType member."""
+        return FileType(self.type)
+
+
+def _id_to_str(value: Any) -> Any:
+    """Render a numeric question ID read from a CSV as a string.
     
-    @validator("type")
-    def validate_file_type(cls, v: FileType) -> FileType:
-        """Validate file type is supported."""
-        if v not in [FileType.CSV, FileType.HTML, FileType.HTM]:
-            raise ValueError(f"Unsupported file type: {v}")
-        return v
+    Args:
+        value: ID value from a DataFrame record
+        
+    Returns:
+        The ID as a string (``1.0`` becomes ``"1"``), or ``value`` unchanged
+        if it is None or already a string
+    """
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
 
 
 class Question(BaseModel):
     """Model representing a question extracted from a document."""
     
+    model_config = ModelConfig(frozen=True)
+    
     id: str = Field(..., description="Unique question identifier")
-    topic: Optional[str] = Field(None, description="Question topic/category")
-    sub_question: Optional[str] = Field(None, description="Sub-question identifier")
-    text: str = Field(..., description="Question text content")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    topic: Optional[InternedStr] = Field(None, description="Question topic/category")
+    sub_question: Optional[InternedStr] = Field(None, description="Sub-question identifier")
+    text: NonEmptyStr = Field(..., description="Question text content")
+    metadata: Any = Field(default_factory=dict, description="Additional metadata (passed through unvalidated)")
     
-    @validator("text")
-    def validate_text_not_empty(cls, v: str) -> str:
-        """Ensure question text is not empty."""
-        if not v.strip():
-            raise ValueError("Question text cannot be empty")
-        return v.strip()
+    @classmethod
+    def from_dataframe(cls, df: "pd.DataFrame") -> List["Question"]:
+        """Validate a DataFrame of questions in one batch.
+        
+        The text column is checked column-wise first, so a bad file fails
+        with every offending row listed instead of on the first one.
+        
+        Args:
+            df: DataFrame with columns matching the Question fields
+            
+        Returns:
+            List of validated Question instances
+            
+        Raises:
+            QuestionExtractionError: If any row has empty question text or
+                otherwise fails validation
+        """
+        text = df['text'].fillna('').astype(str).str.strip()
+        empty_rows = df.index[text.eq('')].tolist()
+        if empty_rows:
+            raise QuestionExtractionError(
+                "Question text cannot be empty",
+                {"rows": empty_rows},
+            )
+        
+        # Missing optional values arrive as NaN; pydantic expects None
+        df = df.assign(text=text).astype(object)
+        records = df.where(df.notna(), None).to_dict('records')
+        for record in records:
+            # pd.read_csv parses IDs like 1, 2, 3 as numbers
+            record['id'] = _id_to_str(record.get('id'))
+        
+        try:
+            return _QUESTION_LIST_ADAPTER.validate_python(records)
+        except ValidationError as e:
+            raise QuestionExtractionError(
+                "Invalid question data",
+                {"errors": e.error_count(), "first_error": e.errors()[0]["msg"]},
+            ) from e
 
 
 class Answer(BaseModel):
     """Model representing an AI-generated answer."""
     
-    question_id: str = Field(..., description="ID of the question being answered")
+    model_config = ModelConfig(frozen=True)
+    
+    question_id: InternedStr = Field(..., description="ID of the question being answered")
     text: str = Field(..., description="Answer text content")
-    confidence: Optional[float] = Field(None, description="Confidence score (0-1)")
-    generated_at: datetime = Field(default_factory=datetime.utcnow, description="Timestamp when answer was generated")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    confidence: Optional[float] = Field(None, ge=0.0, le=1.0, description="Confidence score (0-1)")
+    generated_at: int = Field(default_factory=time.time_ns, description="Generation time in nanoseconds since the epoch")
+    metadata: Any = Field(default_factory=dict, description="Additional metadata (passed through unvalidated)")
     
-    @validator("confidence")
-    def validate_confidence(cls, v: Optional[float]) -> Optional[float]:
-        """Validate confidence score is between 0 and 1."""
-        if v is not None and (v < 0 or v > 1):
-            raise ValueError("Confidence score must be between 0 and 1")
-        return v
+    @property
+    def generated_at_dt(self) -> datetime:
+        """Generation time as a UTC datetime, for display."""
+        return ns_to_datetime(self.generated_at)
 
 
 class QuestionAnswerPair(BaseModel):
     """Model representing a question-answer pair."""
     
+    model_config = ModelConfig(frozen=True, revalidate_instances="never")
+    
     question: Question = Field(..., description="The question")
     answer: Optional[Answer] = Field(None, description="The answer (if generated)")
     selected: bool = Field(True, description="Whether this pair is selected for processing")
@@ -102,79 +180,127 @@ class QuestionAnswerPair(BaseModel):
 class DocumentMetadata(BaseModel):
     """Model representing document metadata."""
     
-    name: str = Field(..., description="Document name")
-    file_type: FileType = Field(..., description="Document file type")
+    model_config = ModelConfig(frozen=True, revalidate_instances="never")
+    
+    name: NonEmptyStr = Field(..., description="Document name")
+    file_type: FileTypeValue = Field(..., description="Document file type")
     size: int = Field(..., description="File size in bytes")
-    upload_time: datetime = Field(default_factory=datetime.utcnow, description="Upload timestamp")
+    upload_time: int = Field(default_factory=time.time_ns, description="Upload time in nanoseconds since the epoch")
     processing_time: Optional[float] = Field(None, description="Processing time in seconds")
     question_count: Optional[int] = Field(None, description="Number of questions extracted")
     
-    @validator("name")
-    def validate_name_not_empty(cls, v: str) -> str:
-        """Ensure document name is not empty."""
-        if not v.strip():
-            raise ValueError("Document name cannot be empty")
-        return v.strip()
+    @property
+    def file_type_enum(self) -> FileType:
+        """File type as a FileType member."""
+        return FileType(self.file_type)
+    
+    @property
+    def upload_time_dt(self) -> datetime:
+        """Upload time as a UTC datetime, for display."""
+        return ns_to_datetime(self.upload_time)
 
 
 class ProcessingSession(BaseModel):
     """Model representing a complete processing session."""
     
+    model_config = ModelConfig(frozen=True, revalidate_instances="never")
+    
     session_id: str = Field(..., description="Unique session identifier")
     document: DocumentMetadata = Field(..., description="Document metadata")
     questions: List[Question] = Field(default_factory=list, description="Extracted questions")
     answers: List[Answer] = Field(default_factory=list, description="Generated answers")
-    current_step: ProcessingStep = Field(ProcessingStep.UPLOAD, description="Current processing step")
+    current_step: ProcessingStepValue = Field(ProcessingStep.UPLOAD.value, description="Current processing step")
     custom_prompt: Optional[str] = Field(None, description="Custom prompt for AI processing")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Session creation time")
-    updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update time")
+    created_at: int = Field(default_factory=time.time_ns, description="Session creation time in nanoseconds since the epoch")
+    updated_at: int = Field(default_factory=time.time_ns, description="Last update time in nanoseconds since the epoch")
+    
+    @property
+    def current_step_enum(self) -> ProcessingStep:
+        """Current step as a ProcessingStep member."""
+        return ProcessingStep(self.current_step)
+    
+    @property
+    def created_at_dt(self) -> datetime:
+        """Session creation time as a UTC datetime, for display."""
+        return ns_to_datetime(self.created_at)
+    
+    @property
+    def updated_at_dt(self) -> datetime:
+        """Last update time as a UTC datetime, for display."""
+        return ns_to_datetime(self.updated_at)
 
 
 class APIRequest(BaseModel):
     """Model for API request payloads."""
     
+    model_config = ModelConfig(frozen=True)
+    
     messages: List[Dict[str, str]] = Field(..., description="Messages for the AI model")
-    max_tokens: int = Field(15000, description="Maximum tokens to generate")
-    temperature: float = Field(0.1, description="Temperature for generation")
+    max_tokens: int = Field(15000, gt=0, description="Maximum tokens to generate")
+    temperature: float = Field(0.1, ge=0.0, le=2.0, description="Temperature for generation")
+
+
+def _no_content(choice: Dict[str, Any]) -> Optional[str]:
+    """Return None for choices with no recognised content field."""
+    return None
+
+
+def _message_content(choice: Dict[str, Any]) -> Optional[str]:
+    """Return the content of a message-format (OpenAI/Claude style) choice."""
+    return choice['message']['content']
+
+
+_choice_text = itemgetter('text')
+
+
+def _content_extractor_for(choice: Dict[str, Any]) -> Callable[[Dict[str, Any]], Optional[str]]:
+    """Return the accessor matching the shape of a response choice.
     
-    @validator("max_tokens")
-    def validate_max_tokens(cls, v: int) -> int:
-        """Validate max tokens is positive."""
-        if v <= 0:
-            raise ValueError("Max tokens must be positive")
-        return v
+    Args:
+        choice: First choice of an API response
+        
+    Returns:
+        Callable that extracts the text content from a choice of that shape
+    """
+    # Check for message format (OpenAI/Claude style API)
+    message = choice.get('message')
+    if isinstance(message, dict) and 'content' in message:
+        return _message_content
+    
+    # Check for text format (older API style)
+    if 'text' in choice:
+        return _choice_text
     
-    @validator("temperature")
-    def validate_temperature(cls, v: float) -> float:
-        """Validate temperature is between 0 and 2."""
-        if v < 0 or v > 2:
-            raise ValueError("Temperature must be between 0 and 2")
-        return v
+    return _no_content
 
 
 class APIResponse(BaseModel):
     """Model for API response data."""
     
+    model_config = ModelConfig(frozen=True)
+    
     choices: List[Dict[str, Any]] = Field(..., description="Response choices")
     usage: Optional[Dict[str, int]] = Field(None, description="Token usage information")
     model: Optional[str] = Field(None, description="Model name used")
     
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> "APIResponse":
+        """Parse and validate a raw response body in a single pass.
+        
+        Args:
+            raw: Response body as returned by the serving endpoint
+            
+        Returns:
+            Validated APIResponse instance
+        """
+        return cls.model_validate_json(raw)
+    
     def get_text_content(self) -> Optional[str]:
         """Extract text content from the response."""
         if not self.choices:
             return None
-        
         choice = self.choices[0]
-        
-        # Check for message format (OpenAI/Claude style API)
-        if 'message' in choice and 'content' in choice['message']:
-            return choice['message']['content']
-        
-        # Check for text format (older API style)
-        if 'text' in choice:
-            return choice['text']
-        
-        return None
+        return _content_extractor_for(choice)(choice)
 
 
 class ExportData(BaseModel):
@@ -186,15 +312,15 @@ class ExportData(BaseModel):
     question_text: str = Field(..., description="Question text")
     answer: str = Field(..., description="Generated answer")
     
-    class Config:
-        """Pydantic configuration."""
-        # Allow conversion from pandas DataFrame
-        arbitrary_types_allowed = True
+    # Allow conversion from pandas DataFrame
+    model_config = ModelConfig(frozen=True, arbitrary_types_allowed=True)
 
 
 class TrackingData(BaseModel):
     """Model for usage tracking data."""
     
+    model_config = ModelConfig(frozen=True)
+    
     customer: str = Field(..., description="Customer name")
     date_processed: datetime = Field(..., description="Processing date")
     user_email: Optional[str] = Field(None, description="User email")
@@ -206,7 +332,23 @@ class TrackingData(BaseModel):
     timezone: str = Field(..., description="Timezone")
 
 
-# Type aliases for common types
-DataFrameType = pd.DataFrame
+# Bulk validator for Question.from_dataframe, built once so the schema is
+# compiled at import time
+_QUESTION_LIST_ADAPTER: TypeAdapter[List[Question]] = TypeAdapter(List[Question])
+
+
+# Type aliases for common types; DataFrameType resolves through __getattr__
 SessionState = Dict[str, Any]
-ConfigDict = Dict[str, Any] 
\ No newline at end of file
+ConfigDict = Dict[str, Any]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``DataFrameType`` on first access.
+    
+    Importing this module therefore doesn't import pandas.
+    """
+    if name == "DataFrameType":
+        import pandas as pd
+        globals()[name] = pd.DataFrame
+        return pd.DataFrame
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,12 +4,23 @@ This module handles generating responses to questions using AI models,
 with support for both individual and batch processing.
 """
 
+import hashlib
+import json
+import random
 import re
+import threading
 import time
-from typing import Dict, List, Optional, Any, Tuple, Callable
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Any, Tuple, Callable, Sequence
 import requests
-import pandas as pd
-from tenacity import retry, stop_after_attempt, wait_fixed
+from requests.adapters import HTTPAdapter
+
+try:
+    # orjson decodes multi-KB completion bodies several times faster
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 from aria.core.logging_config import get_logger
 from aria.config.config import (
@@ -19,6 +30,105 @@ from aria.config.config import (
 
 logger = get_logger(__name__)
 
+# "<id>: <answer>" blocks in a topic response, each ending at the next
+# blank-line-separated sub-question ID
+_SUB_QUESTION_RE = re.compile(r'(\d+(?:\.\d+)*):?\s*(.*?)(?=\n\n\d+(?:\.\d+)*:|\Z)', re.DOTALL)
+
+# Responses keyed by a hash of (model, system prompt, user prompt), shared by
+# every service instance so re-running the same document skips the API;
+# callers pass use_cache=False when the user explicitly asks for new answers
+_RESPONSE_CACHE_MAX_ENTRIES = 2048
+_response_cache: Dict[str, str] = {}
+_response_cache_lock = threading.Lock()
+
+
+def _response_cache_key(model_name: str, system_prompt: str, user_prompt: str) -> str:
+    """Return the cache key for a generation request."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (model_name, system_prompt, user_prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+# How often a running batch re-resolves its auth headers in the background;
+# well inside the lifetime of a Databricks OAuth token
+_AUTH_REFRESH_INTERVAL_SECONDS = 300
+
+
+class _AuthRefresher:
+    """Keeps a batch's auth headers fresh on a background thread.
+    
+    The headers dict is updated in place, so every request made during the
+    batch picks up the new token without re-resolving it inline.
+    """
+    
+    def __init__(self, settings: Any, headers: Dict[str, str], interval: float = _AUTH_REFRESH_INTERVAL_SECONDS) -> None:
+        """Initialize the refresher.
+        
+        Args:
+            settings: Application config providing refresh_auth()
+            headers: Headers dict shared with the batch, updated in place
+            interval: Seconds between refreshes
+        """
+        self._settings = settings
+        self._headers = headers
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="auth-refresher", daemon=True)
+    
+    def __enter__(self) -> "_AuthRefresher":
+        """Start refreshing in the background."""
+        self._thread.start()
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        self._thread.join(timeout=1)
+    
+    def _run(self) -> None:
+        """Refresh the headers every interval until the batch finishes."""
+        while not self._stop.wait(self._interval):
+            try:
+                fresh_headers = self._settings.refresh_auth()
+            except Exception as e:
+                logger.warning(f"Background auth refresh failed: {str(e)}")
+                continue
+            if fresh_headers:
+                self._headers.update(fresh_headers)
+
+
+# Responses worth retrying: rate limiting and transient server-side failures
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRY_DELAY_SECONDS = 30.0
+
+
+def _retry_delay(attempt: int, response: Optional[requests.Response]) -> float:
+    """Return how long to wait before the next attempt.
+    
+    Args:
+        attempt: Number of failed attempts so far (1-based)
+        response: Failed response, or None for a connection error
+        
+    Returns:
+        Delay in seconds, honouring a numeric Retry-After header when present
+    """
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), _MAX_RETRY_DELAY_SECONDS)
+    backoff = RETRY_WAIT_SECONDS * 2 ** (attempt - 1) + random.uniform(0, 1)
+    return min(backoff, _MAX_RETRY_DELAY_SECONDS)
+
+
+def _store_response(cache_key: str, response_text: str) -> None:
+    """Cache a successful response, evicting the oldest entry when full."""
+    with _response_cache_lock:
+        if len(_response_cache) >= _RESPONSE_CACHE_MAX_ENTRIES:
+            _response_cache.pop(next(iter(_response_cache)))
+        _response_cache[cache_key] = response_text
+
 
 class AnswerGenerationService:
     """Service for generating answers to questions using AI."""
@@ -27,12 +137,38 @@ class AnswerGenerationService:
         """Initialize the answer generation service."""
         self.settings = config
         self.timeout = DEFAULT_TIMEOUT_SECONDS
+        self.max_concurrency = self.settings.models.max_concurrency
+        
+        # Resolved once; every generation call in a batch uses the same values
+        self._endpoint_url = self.settings.answer_generation_endpoint
+        self._model_name = self.settings.models.answer_generation_model
+        self._payload_template: Dict[str, Any] = {"max_tokens": 1000, "temperature": 0.1}
+        
+        # One pooled session per service so concurrent calls reuse keep-alive
+        # connections instead of opening a new TLS connection per request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency * 2)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+    
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        self._session.close()
+    
+    def __enter__(self) -> "AnswerGenerationService":
+        """Use the service as a context manager that closes its session."""
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the pooled HTTP connections on exit."""
+        self.close()
     
     def generate_answers(
         self,
         questions: List[Dict[str, Any]],
         custom_prompt: str = "",
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        use_cache: bool = True
     ) -> Tuple[bool, List[Dict[str, Any]], Dict[str, Any]]:
         """Generate answers for a list of questions.
         
@@ -40,6 +176,7 @@ class AnswerGenerationService:
             questions: List of question dictionaries
             custom_prompt: Custom prompt for answer generation
             progress_callback: Optional callback for progress updates (current, total, status)
+            use_cache: Reuse cached responses for identical prompts; False forces fresh answers
             
         Returns:
             Tuple of (success, answers_list, generation_info)
@@ -62,15 +199,19 @@ class AnswerGenerationService:
                 generation_info["errors"].append("Authentication not configured")
                 return False, [], generation_info
             
+            # The batch owns a copy that the refresher keeps current
+            auth_headers = dict(auth_headers)
+            
             # Determine the best processing method based on question structure
-            if self._has_hierarchical_structure(questions):
-                logger.info("Using topic-based batch processing")
-                success, answers = self._generate_by_topics(questions, custom_prompt, auth_headers, progress_callback)
-                generation_info["method"] = "topic_batch"
-            else:
-                logger.info("Using individual question processing")
-                success, answers = self._generate_individual(questions, custom_prompt, auth_headers, progress_callback)
-                generation_info["method"] = "individual"
+            with _AuthRefresher(self.settings, auth_headers):
+                if self._has_hierarchical_structure(questions):
+                    logger.info("Using topic-based batch processing")
+                    success, answers = self._generate_by_topics(questions, custom_prompt, auth_headers, progress_callback, use_cache)
+                    generation_info["method"] = "topic_batch"
+                else:
+                    logger.info("Using individual question processing")
+                    success, answers = self._generate_individual(questions, custom_prompt, auth_headers, progress_callback, use_cache)
+                    generation_info["method"] = "individual"
             
             generation_info["processing_time"] = time.time() - start_time
             generation_info["questions_processed"] = len(questions)
@@ -111,44 +252,37 @@ class AnswerGenerationService:
         questions: List[Dict[str, Any]],
         custom_prompt: str,
         auth_headers: Dict[str, str],
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        use_cache: bool = True
     ) -> Tuple[bool, List[Dict[str, Any]]]:
         """Generate answers by grouping questions by topic.
         
         Args:
             questions: List of question dictionaries
             custom_prompt: Custom prompt for generation
-            auth_headers: Authentication headers (will be refreshed as needed)
+            auth_headers: Authentication headers, refreshed in place during the batch
             progress_callback: Progress callback function
+            use_cache: Reuse cached responses for identical prompts
             
         Returns:
             Tuple of (success, answers_list)
         """
         try:
             # Group questions by topic
-            df = pd.DataFrame(questions)
-            grouped_df = self._group_questions_by_topic(df)
+            topic_rows = self._group_questions_by_topic(questions)
+            model_name = self._model_name
+            
+            # auth_headers is shared by every call and refreshed in place, both
+            # in the background and by _call_generation_api on a rejected token
+            results = self._run_concurrently(
+                lambda row: self._generate_topic_answers(row, custom_prompt, auth_headers, use_cache),
+                topic_rows,
+                progress_callback,
+                lambda row: f"{model_name} answered topic: {row['topic']}"
+            )
             
-            total_topics = len(grouped_df)
             all_answers = []
-            
-            for i, (idx, row) in enumerate(grouped_df.iterrows()):
-                if progress_callback:
-                    model_name = self.settings.models.answer_generation_model
-                    progress_callback(i + 1, total_topics, f"Calling {model_name} for topic: {row['topic']}")
-                
-                # Get fresh auth headers for each topic to handle potential token expiration
-                # This is especially important for long-running batch processes
-                current_auth_headers = self.settings.get_auth_headers()
-                if not current_auth_headers:
-                    logger.error("Authentication headers are no longer available")
-                    break
-                
-                # Generate answers for this topic
-                success, topic_answers = self._generate_topic_answers(
-                    row, custom_prompt, current_auth_headers
-                )
-                
+            for row, (success, topic_answers) in zip(topic_rows, results):
                 if success:
                     all_answers.extend(topic_answers)
                 else:
@@ -165,50 +299,60 @@ class AnswerGenerationService:
         questions: List[Dict[str, Any]],
         custom_prompt: str,
         auth_headers: Dict[str, str],
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        use_cache: bool = True
     ) -> Tuple[bool, List[Dict[str, Any]]]:
         """Generate answers for individual questions.
         
         Args:
             questions: List of question dictionaries
             custom_prompt: Custom prompt for generation
-            auth_headers: Authentication headers (will be refreshed as needed)
+            auth_headers: Authentication headers, refreshed in place during the batch
             progress_callback: Progress callback function
+            use_cache: Reuse cached responses for identical prompts
             
         Returns:
             Tuple of (success, answers_list)
         """
         try:
-            total_questions = len(questions)
-            answers = []
+            model_name = self._model_name
             
+            # Questions that expand to the same prompt (e.g. duplicated rows)
+            # share a single API call; keyed by prompt, in first-seen order
+            prompt_indices: Dict[str, List[int]] = {}
             for idx, question in enumerate(questions):
-                if progress_callback:
-                    question_preview = question.get('text', question.get('Question', ''))[:50]
-                    model_name = self.settings.models.answer_generation_model
-                    progress_callback(idx + 1, total_questions, f"Calling {model_name}: {question_preview}...")
-                
-                # Get fresh auth headers for each question to handle potential token expiration
-                current_auth_headers = self.settings.get_auth_headers()
-                if not current_auth_headers:
-                    logger.error("Authentication headers are no longer available")
-                    break
-                
-                # Generate answer for this question
-                success, answer = self._generate_single_answer(
-                    question, custom_prompt, current_auth_headers
-                )
-                
-                if success:
-                    answers.append(answer)
-                else:
-                    # Add a placeholder answer for failed questions
-                    answers.append({
-                        "question_id": question.get('id', f"Q{idx+1}"),
-                        "question_text": question.get('text', question.get('Question', '')),
-                        "answer": "Error: Failed to generate answer",
-                        "topic": question.get('topic', 'Unknown')
-                    })
+                question_text = question.get('text', question.get('Question', ''))
+                user_prompt = self._build_single_user_prompt(question_text, custom_prompt)
+                prompt_indices.setdefault(user_prompt, []).append(idx)
+            
+            index_groups = list(prompt_indices.values())
+            if len(index_groups) < len(questions):
+                logger.info(f"Deduplicated {len(questions)} questions into {len(index_groups)} unique prompts")
+            
+            # auth_headers is shared by every call and refreshed in place
+            results = self._run_concurrently(
+                lambda indices: self._generate_single_answer(questions[indices[0]], custom_prompt, auth_headers, use_cache),
+                index_groups,
+                progress_callback,
+                lambda indices: f"{model_name} answered: {questions[indices[0]].get('text', questions[indices[0]].get('Question', ''))[:50]}..."
+            )
+            
+            answers: List[Any] = [None] * len(questions)
+            for indices, (success, answer) in zip(index_groups, results):
+                for idx in indices:
+                    question = questions[idx]
+                    if not success:
+                        # Add a placeholder answer for failed questions
+                        answers[idx] = {
+                            "question_id": question.get('id', f"Q{idx+1}"),
+                            "question_text": question.get('text', question.get('Question', '')),
+                            "answer": "Error: Failed to generate answer",
+                            "topic": question.get('topic', 'Unknown')
+                        }
+                    elif idx == indices[0]:
+                        answers[idx] = answer
+                    else:
+                        answers[idx] = self._build_answer(question, answer["answer"])
             
             return True, answers
             
@@ -216,55 +360,104 @@ class AnswerGenerationService:
             logger.error(f"Error in individual generation: {str(e)}")
             return False, []
     
-    def _group_questions_by_topic(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Group questions by topic for batch processing.
+    def _run_concurrently(
+        self,
+        func: Callable[[Any], Any],
+        items: Sequence[Any],
+        progress_callback: Optional[Callable[[int, int, str], None]],
+        describe: Callable[[Any], str]
+    ) -> List[Any]:
+        """Call ``func`` on every item with up to ``max_concurrency`` requests in flight.
+        
+        The progress callback runs on the calling thread as each item finishes,
+        since Streamlit elements cannot be updated from worker threads. If it
+        raises (e.g. the user reruns or stops the script), queued calls are
+        cancelled instead of waiting for the rest of the batch.
         
         Args:
-            df: DataFrame with questions
+            func: Function to apply to each item
+            items: Items to process
+            progress_callback: Progress callback function
+            describe: Builds the progress status for a finished item
             
         Returns:
-            DataFrame grouped by topic
+            Results of ``func`` in the same order as ``items``
         """
+        total = len(items)
+        results: List[Any] = [None] * total
+        if not total:
+            return results
+        
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, total),
+            thread_name_prefix="answer-generation"
+        )
         try:
-            # Group by topic and aggregate
-            grouped_df = df.groupby(['topic']).agg({
-                'question': 'first',  # Keep the main question ID
-                'sub_question': lambda x: list(x),  # List of all sub-questions
-                'text': lambda x: '\n\n'.join(f"{sq}: {txt}" for sq, txt in zip(df.loc[x.index, 'sub_question'], x))
-            }).reset_index()
-            
-            # Add question count for each topic
-            grouped_df['question_count'] = grouped_df['sub_question'].apply(len)
-            
-            # Create original_questions data for each topic by looking up the original rows
-            original_questions_list = []
-            for _, row in grouped_df.iterrows():
-                topic = row['topic']
-                topic_mask = df['topic'] == topic
-                topic_questions = df.loc[topic_mask].to_dict('records')
-                original_questions_list.append(topic_questions)
-            
-            grouped_df['original_questions'] = original_questions_list
+            futures = {executor.submit(func, item): index for index, item in enumerate(items)}
+            for completed, future in enumerate(as_completed(futures), start=1):
+                index = futures[future]
+                results[index] = future.result()
+                if progress_callback:
+                    progress_callback(completed, total, describe(items[index]))
+        except BaseException:
+            # Streamlit's rerun/stop signals derive from BaseException
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        
+        executor.shutdown()
+        return results
+    
+    def _group_questions_by_topic(self, questions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Group questions by topic for batch processing.
+        
+        Args:
+            questions: List of question dictionaries
             
-            logger.info(f"Grouped {len(df)} questions into {len(grouped_df)} topics")
-            return grouped_df
+        Returns:
+            One dictionary per topic, in the order topics first appear
+        """
+        try:
+            buckets: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+            for question in questions:
+                topic = question.get('topic')
+                # Questions without a topic (None or NaN from a CSV) can't be batched
+                if topic is None or topic != topic:
+                    continue
+                buckets[topic].append(question)
+            
+            topics = [
+                {
+                    'topic': topic,
+                    'question': topic_questions[0]['question'],  # Keep the main question ID
+                    'sub_question': [q['sub_question'] for q in topic_questions],  # List of all sub-questions
+                    'text': '\n\n'.join(f"{q['sub_question']}: {q['text']}" for q in topic_questions),
+                    'question_count': len(topic_questions),
+                    'original_questions': topic_questions
+                }
+                for topic, topic_questions in buckets.items()
+            ]
+            
+            logger.info(f"Grouped {len(questions)} questions into {len(topics)} topics")
+            return topics
             
         except Exception as e:
             logger.error(f"Error grouping questions by topic: {str(e)}")
-            return pd.DataFrame()
+            return []
     
     def _generate_topic_answers(
         self,
-        topic_row: pd.Series,
+        topic_row: Dict[str, Any],
         custom_prompt: str,
-        auth_headers: Dict[str, str]
+        auth_headers: Dict[str, str],
+        use_cache: bool = True
     ) -> Tuple[bool, List[Dict[str, Any]]]:
         """Generate answers for all questions in a topic.
         
         Args:
-            topic_row: Row from grouped DataFrame containing topic info
+            topic_row: Grouped topic dictionary from _group_questions_by_topic
             custom_prompt: Custom prompt for generation
             auth_headers: Authentication headers
+            use_cache: Reuse a cached response for an identical prompt
             
         Returns:
             Tuple of (success, answers_list)
@@ -282,7 +475,7 @@ class AnswerGenerationService:
             user_prompt = self._build_topic_user_prompt(topic, question_text, custom_prompt)
             
             # Make API call
-            success, response_text = self._call_generation_api(system_prompt, user_prompt, auth_headers)
+            success, response_text = self._call_generation_api(system_prompt, user_prompt, auth_headers, use_cache)
             
             if not success:
                 return False, []
@@ -300,7 +493,8 @@ class AnswerGenerationService:
         self,
         question: Dict[str, Any],
         custom_prompt: str,
-        auth_headers: Dict[str, str]
+        auth_headers: Dict[str, str],
+        use_cache: bool = True
     ) -> Tuple[bool, Dict[str, Any]]:
         """Generate answer for a single question.
         
@@ -308,38 +502,47 @@ class AnswerGenerationService:
             question: Question dictionary
             custom_prompt: Custom prompt for generation
             auth_headers: Authentication headers
+            use_cache: Reuse a cached response for an identical prompt
             
         Returns:
             Tuple of (success, answer_dict)
         """
         try:
             question_text = question.get('text', question.get('Question', ''))
-            question_id = question.get('sub_question', question.get('id', question.get('ID', 'Q1')))
             
             # Build prompt for this question
             system_prompt = self._build_generation_prompt()
             user_prompt = self._build_single_user_prompt(question_text, custom_prompt)
             
             # Make API call
-            success, response_text = self._call_generation_api(system_prompt, user_prompt, auth_headers)
+            success, response_text = self._call_generation_api(system_prompt, user_prompt, auth_headers, use_cache)
             
             if not success:
                 return False, {}
             
-            # Create answer dictionary
-            answer = {
-                "question_id": question_id,
-                "question_text": question_text,
-                "answer": response_text.strip(),
-                "topic": question.get('topic', 'General')
-            }
-            
-            return True, answer
+            return True, self._build_answer(question, response_text)
             
         except Exception as e:
             logger.error(f"Error generating single answer: {str(e)}")
             return False, {}
     
+    def _build_answer(self, question: Dict[str, Any], response_text: str) -> Dict[str, Any]:
+        """Create the answer dictionary for a question.
+        
+        Args:
+            question: Question dictionary
+            response_text: Generated answer text
+            
+        Returns:
+            Answer dictionary
+        """
+        return {
+            "question_id": question.get('sub_question', question.get('id', question.get('ID', 'Q1'))),
+            "question_text": question.get('text', question.get('Question', '')),
+            "answer": response_text.strip(),
+            "topic": question.get('topic', 'General')
+        }
+    
     def _build_generation_prompt(self) -> str:
         """Build the system prompt for answer generation.
         
@@ -385,127 +588,141 @@ class AnswerGenerationService:
         
         return base_prompt
     
-    @retry(stop=stop_after_attempt(MAX_RETRIES), wait=wait_fixed(RETRY_WAIT_SECONDS))
     def _call_generation_api(
         self,
         system_prompt: str,
         user_prompt: str,
-        auth_headers: Dict[str, str]
+        auth_headers: Dict[str, str],
+        use_cache: bool = True
     ) -> Tuple[bool, str]:
         """Call the AI API for answer generation.
         
+        Transient failures (connection errors, timeouts, 429 and 5xx) are retried
+        up to MAX_RETRIES attempts with jittered exponential backoff. An expired
+        JWT is refreshed once and retried without using up an attempt.
+        
         Args:
             system_prompt: System prompt for AI
             user_prompt: User prompt with content
             auth_headers: Authentication headers
+            use_cache: Return a cached response for an identical prompt if present
             
         Returns:
             Tuple of (success, response_text)
         """
+        endpoint_url = self._endpoint_url
+        model_name = self._model_name
+        
         try:
-            endpoint_url = self.settings.answer_generation_endpoint
-            model_name = self.settings.models.answer_generation_model
+            cache_key = _response_cache_key(model_name, system_prompt, user_prompt)
+            cached_text = _response_cache.get(cache_key) if use_cache else None
+            if cached_text is not None:
+                logger.info(f"Using cached {model_name} response for identical prompt")
+                return True, cached_text
             
             payload = {
                 "messages": [
                     {"role": "user", "content": user_prompt}  # Omit system message as requested
                 ],
-                "max_tokens": 1000,
-                "temperature": 0.1
+                **self._payload_template
             }
             
-            logger.info(f"Calling {model_name} for answer generation: {endpoint_url}")
-            
-            response = requests.post(
-                endpoint_url,
-                headers=auth_headers,
-                json=payload,
-                timeout=self.timeout
-            )
-            
-            # Check for JWT token expiration (403 with specific error pattern)
-            if response.status_code == 403:
-                response_text = response.text
+            attempt = 0
+            token_refreshed = False
+            while True:
+                logger.info(f"Calling {model_name} for answer generation: {endpoint_url}")
                 
-                # Check if this is a JWT expiration error
-                if ("ExpiredJwtException" in response_text or 
-                    "JWT expired" in response_text or
-                    "token expired" in response_text.lower()):
-                    
-                    logger.warning("JWT token expired, attempting to refresh authentication")
-                    
-                    # Get fresh authentication headers
-                    fresh_auth_headers = self.settings.get_auth_headers()
+                # Snapshot the shared headers: other workers and the background
+                # refresher may swap the token while this request is in flight
+                sent_headers = dict(auth_headers)
+                try:
+                    response = self._session.post(
+                        endpoint_url,
+                        headers=sent_headers,
+                        json=payload,
+                        timeout=self.timeout
+                    )
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    response = None
+                    failure = str(e)
+                else:
+                    failure = f"status {response.status_code}: {response.text}"
+                
+                if response is not None and response.status_code == 200:
+                    response_data = _json_loads(response.content)
                     
-                    if fresh_auth_headers and fresh_auth_headers != auth_headers:
-                        logger.info("Retrieved fresh authentication token, retrying API call")
+                    # Extract response text
+                    if "choices" in response_data and len(response_data["choices"]) > 0:
+                        choice = response_data["choices"][0]
                         
-                        # Retry with fresh token
-                        retry_response = requests.post(
-                            endpoint_url,
-                            headers=fresh_auth_headers,
-                            json=payload,
-                            timeout=self.timeout
-                        )
-                        
-                        if retry_response.status_code == 200:
-                            response_data = retry_response.json()
-                            
-                            # Extract response text
-                            if "choices" in response_data and len(response_data["choices"]) > 0:
-                                choice = response_data["choices"][0]
-                                
-                                # Check for message format (OpenAI/Claude style API)
-                                if 'message' in choice and 'content' in choice['message']:
-                                    response_text = choice['message']['content']
-                                # Check for text format (older API style)
-                                elif 'text' in choice:
-                                    response_text = choice['text']
-                                else:
-                                    logger.warning("Unexpected response format")
-                                    response_text = str(choice)
-                                
-                                logger.info(f"{model_name} generation API call successful after token refresh")
-                                return True, response_text
-                            else:
-                                logger.error("Unexpected API response format after token refresh")
-                                return False, ""
+                        # Check for message format (OpenAI/Claude style API)
+                        if 'message' in choice and 'content' in choice['message']:
+                            response_text = choice['message']['content']
+                        # Check for text format (older API style)
+                        elif 'text' in choice:
+                            response_text = choice['text']
                         else:
-                            logger.error(f"API call failed even after token refresh with status {retry_response.status_code}: {retry_response.text}")
-                            return False, ""
+                            logger.warning("Unexpected response format")
+                            logger.info(f"{model_name} generation API call successful")
+                            # Not cached: a raw choice dump is no answer to reuse
+                            return True, str(choice)
+                        
+                        logger.info(f"{model_name} generation API call successful")
+                        _store_response(cache_key, response_text)
+                        return True, response_text
                     else:
-                        logger.error("Could not refresh authentication token or got same token")
+                        logger.error("Unexpected API response format")
                         return False, ""
-                else:
-                    # Non-token related 403 error
-                    logger.error(f"Authentication error (403): {response_text}")
-                    return False, ""
-            
-            elif response.status_code == 200:
-                response_data = response.json()
                 
-                # Extract response text
-                if "choices" in response_data and len(response_data["choices"]) > 0:
-                    choice = response_data["choices"][0]
+                # Check for token expiration (401, or 403 with specific error pattern)
+                if response is not None and response.status_code in (401, 403):
+                    response_text = response.text
                     
-                    # Check for message format (OpenAI/Claude style API)
-                    if 'message' in choice and 'content' in choice['message']:
-                        response_text = choice['message']['content']
-                    # Check for text format (older API style)
-                    elif 'text' in choice:
-                        response_text = choice['text']
-                    else:
-                        logger.warning("Unexpected response format")
-                        response_text = str(choice)
+                    if response.status_code == 403 and not (
+                            "ExpiredJwtException" in response_text or 
+                            "JWT expired" in response_text or
+                            "token expired" in response_text.lower()):
+                        # Non-token related 403 error
+                        logger.error(f"Authentication error (403): {response_text}")
+                        return False, ""
                     
-                    logger.info(f"{model_name} generation API call successful")
-                    return True, response_text
-                else:
-                    logger.error("Unexpected API response format")
+                    if token_refreshed:
+                        logger.error(f"API call failed even after token refresh with status {response.status_code}: {response_text}")
+                        return False, ""
+                    
+                    token_refreshed = True
+                    
+                    if auth_headers != sent_headers:
+                        # Another call already refreshed the shared token
+                        logger.info("Authentication token was refreshed concurrently, retrying API call")
+                        continue
+                    
+                    logger.warning("Authentication token rejected, attempting to refresh authentication")
+                    
+                    # Get fresh authentication headers
+                    fresh_auth_headers = self.settings.refresh_auth()
+                    if not fresh_auth_headers or fresh_auth_headers == sent_headers:
+                        logger.error("Could not refresh authentication token or got same token")
+                        return False, ""
+                    
+                    logger.info("Retrieved fresh authentication token, retrying API call")
+                    
+                    # Update the batch's shared headers so later calls use the new token
+                    auth_headers.update(fresh_auth_headers)
+                    continue
+                
+                if response is not None and response.status_code not in _RETRYABLE_STATUS_CODES:
+                    logger.error(f"API call failed with {failure}")
                     return False, ""
-            else:
-                logger.error(f"API call failed with status {response.status_code}: {response.text}")
-                return False, ""
+                
+                attempt += 1
+                if attempt >= MAX_RETRIES:
+                    logger.error(f"API call failed after {attempt} attempts with {failure}")
+                    return False, ""
+                
+                delay = _retry_delay(attempt, response)
+                logger.warning(f"Transient {model_name} API failure ({failure}); retrying in {delay:.1f}s")
+                time.sleep(delay)
                 
         except Exception as e:
             logger.error(f"Error calling {model_name} generation API: {str(e)}")
@@ -542,13 +759,21 @@ class AnswerGenerationService:
                         question_text_map[sub_q_id] = question_text
             
             # Parse with regex to match sub-question IDs with their answers
-            pattern = r'(\d+(?:\.\d+)*):?\s*(.*?)(?=\n\n\d+(?:\.\d+)*:|\Z)'
-            matches = re.findall(pattern, response_text, flags=re.DOTALL)
+            matches = _SUB_QUESTION_RE.findall(response_text)
             
             if matches:
                 # Build a dictionary of sub_question_id -> answer
                 answer_dict = {q_id.strip(): answer.strip() for q_id, answer in matches}
                 
+                # Index the parsed IDs once so partial matching doesn't rescan
+                # answer_dict for every sub-question: a parsed ID matches when it
+                # is a substring of sub_q (which covers suffixes) or equal to it
+                # ignoring dots, and the earliest such ID in the response wins
+                id_position = {q_id: position for position, q_id in enumerate(answer_dict)}
+                id_by_nodots: Dict[str, str] = {}
+                for q_id in answer_dict:
+                    id_by_nodots.setdefault(q_id.replace('.', ''), q_id)
+                
                 # Match each sub_question_id to the extracted answers
                 for sub_q in sub_question_ids:
                     answer_text = ""
@@ -558,12 +783,16 @@ class AnswerGenerationService:
                         answer_text = answer_dict[sub_q]
                     else:
                         # Try to find partial matches
-                        for q_id in answer_dict:
-                            if (sub_q.endswith(q_id) or 
-                                q_id in sub_q or 
-                                sub_q.replace('.', '') == q_id.replace('.', '')):
-                                answer_text = answer_dict[q_id]
-                                break
+                        candidates = {
+                            sub_q[start:end]
+                            for start in range(len(sub_q))
+                            for end in range(start + 1, len(sub_q) + 1)
+                        }.intersection(id_position)
+                        nodots_match = id_by_nodots.get(sub_q.replace('.', ''))
+                        if nodots_match is not None:
+                            candidates.add(nodots_match)
+                        if candidates:
+                            answer_text = answer_dict[min(candidates, key=id_position.__getitem__)]
                     
                     # If no match found, use the full response
                     if not answer_text:
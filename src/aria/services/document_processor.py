@@ -10,7 +10,7 @@ from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 
 from aria.core.logging_config import get_logger
-from aria.config.config import SUPPORTED_FILE_TYPES, MAX_FILE_SIZE_MB
+from aria.config.config import SUPPORTED_FILE_TYPES, SUPPORTED_EXTENSIONS, MAX_FILE_SIZE_MB
 
 logger = get_logger(__name__)
 
@@ -20,7 +20,7 @@ class DocumentProcessor:
     
     def __init__(self) -> None:
         """Initialize the document processor."""
-        self.supported_types = SUPPORTED_FILE_TYPES
+        self.supported_types = SUPPORTED_EXTENSIONS
         self.max_size_mb = MAX_FILE_SIZE_MB
     
     def validate_file(self, file_path: str) -> Tuple[bool, List[str]]:
@@ -42,7 +42,7 @@ class DocumentProcessor:
         # Check file extension
         file_extension = Path(file_path).suffix.lower()
         if file_extension not in self.supported_types:
-            errors.append(f"Unsupported file type: {file_extension}. Supported types: {', '.join(self.supported_types)}")
+            errors.append(f"Unsupported file type: {file_extension}. Supported types: {', '.join(SUPPORTED_FILE_TYPES)}")
         
         # Check file size
         file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
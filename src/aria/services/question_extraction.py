@@ -19,6 +19,10 @@ from aria.config.config import (
 
 logger = get_logger(__name__)
 
+# The default system message is identical on every extraction call, so it is
+# serialized once instead of being re-encoded inside each request payload
+_SYSTEM_MESSAGE_JSON = json.dumps({"role": "system", "content": QUESTION_EXTRACTION_SYSTEM_PROMPT})
+
 
 class TemporaryServiceUnavailableError(Exception):
     """Exception for temporary service unavailability (503 errors)."""
@@ -251,6 +255,26 @@ class QuestionExtractionService:
         
         return base_prompt
     
+    def _build_request_body(self, system_prompt: str, user_prompt: str) -> bytes:
+        """Serialize the extraction request payload.
+        
+        Args:
+            system_prompt: System prompt for AI
+            user_prompt: User prompt with content
+            
+        Returns:
+            UTF-8 encoded JSON request body
+        """
+        if system_prompt == QUESTION_EXTRACTION_SYSTEM_PROMPT:
+            system_message = _SYSTEM_MESSAGE_JSON
+        else:
+            system_message = json.dumps({"role": "system", "content": system_prompt})
+        user_message = json.dumps({"role": "user", "content": user_prompt})
+        return (
+            f'{{"messages": [{system_message}, {user_message}], '
+            f'"max_tokens": 15000, "temperature": 0.1}}'
+        ).encode("utf-8")
+    
     def _call_extraction_api_with_retry(
         self, 
         system_prompt: str, 
@@ -319,21 +343,14 @@ class QuestionExtractionService:
             if model_name != self.settings.models.question_extraction_model:
                 endpoint_url = self.settings.databricks.get_model_endpoint_url(model_name)
             
-            payload = {
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                "max_tokens": 15000,
-                "temperature": 0.1
-            }
+            request_body = self._build_request_body(system_prompt, user_prompt)
             
             logger.info(f"Calling {model_name} for question extraction: {endpoint_url}")
             
             response = requests.post(
                 endpoint_url,
                 headers=auth_headers,
-                json=payload,
+                data=request_body,
                 timeout=self.timeout
             )
             
@@ -348,18 +365,19 @@ class QuestionExtractionService:
                 else:
                     logger.error("Unexpected API response format")
                     return False, ""
-            elif response.status_code == 403:
+            elif response.status_code in (401, 403):
                 response_text = response.text
                 
-                # Check if this is a JWT expiration error
-                if ("ExpiredJwtException" in response_text or 
+                # Check if this is a JWT expiration error (any 401 means the token was rejected)
+                if (response.status_code == 401 or
+                    "ExpiredJwtException" in response_text or 
                     "JWT expired" in response_text or
                     "token expired" in response_text.lower()):
                     
                     logger.warning("JWT token expired, attempting to refresh authentication")
                     
                     # Get fresh authentication headers
-                    fresh_auth_headers = self.settings.get_auth_headers()
+                    fresh_auth_headers = self.settings.refresh_auth()
                     
                     if fresh_auth_headers and fresh_auth_headers != auth_headers:
                         logger.info("Retrieved fresh authentication token, retrying API call")
@@ -368,7 +386,7 @@ class QuestionExtractionService:
                         retry_response = requests.post(
                             endpoint_url,
                             headers=fresh_auth_headers,
-                            json=payload,
+                            data=request_body,
                             timeout=self.timeout
                         )
                         
@@ -452,21 +470,14 @@ class QuestionExtractionService:
             if model_name != self.settings.models.question_extraction_model:
                 endpoint_url = self.settings.databricks.get_model_endpoint_url(model_name)
             
-            payload = {
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                "max_tokens": 15000,
-                "temperature": 0.1
-            }
+            request_body = self._build_request_body(system_prompt, user_prompt)
             
             logger.info(f"Extended retry - calling {model_name} for question extraction: {endpoint_url}")
             
             response = requests.post(
                 endpoint_url,
                 headers=auth_headers,
-                json=payload,
+                data=request_body,
                 timeout=self.timeout
             )
             
@@ -11,6 +11,48 @@ from typing import Optional
 from aria.ui.state_manager import StateManager
 from aria.core.logging_config import log_info, log_warning, log_error
 
+# Block size for pyarrow's CSV reader
+_CSV_BLOCK_SIZE = 1024 * 1024
+
+
+def parse_csv(file_path: str) -> pd.DataFrame:
+    """Parse a CSV file, preferring pyarrow's multithreaded reader.
+    
+    Args:
+        file_path: Path to the CSV file
+        
+    Returns:
+        Parsed DataFrame
+    """
+    try:
+        import pyarrow.csv as pa_csv
+        table = pa_csv.read_csv(file_path, read_options=pa_csv.ReadOptions(block_size=_CSV_BLOCK_SIZE))
+        return table.to_pandas(self_destruct=True)
+    except Exception:
+        # pyarrow missing or unable to parse this file; use the pandas C engine
+        return pd.read_csv(file_path, engine="c", low_memory=False)
+
+
+# Entries are keyed by per-session temp paths, so bound how many parsed
+# files the process keeps and for how long
+@st.cache_data(show_spinner=False, max_entries=16, ttl=3600)
+def _read_csv_version(file_path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parse one version of a CSV file; mtime and size are part of the cache key."""
+    return parse_csv(file_path)
+
+
+def read_csv_cached(file_path: str) -> pd.DataFrame:
+    """Parse a CSV file, reusing the result until the file changes.
+    
+    Args:
+        file_path: Path to the CSV file
+        
+    Returns:
+        Parsed DataFrame
+    """
+    file_stat = os.stat(file_path)
+    return _read_csv_version(file_path, file_stat.st_mtime_ns, file_stat.st_size)
+
 
 def render_file_preview(state_manager: StateManager) -> None:
     """Render file preview in the sidebar.
@@ -147,7 +189,8 @@ def _render_csv_preview(file_path: str) -> None:
         file_path: Path to the CSV file
     """
     try:
-        df = pd.read_csv(file_path)
+        # The sidebar renders on every rerun; parse the file only when it changes
+        df = read_csv_cached(file_path)
         st.sidebar.markdown("### CSV Preview")
         st.sidebar.dataframe(df.head(5), use_container_width=True, height=200)
         
@@ -233,6 +233,7 @@ def _process_question_async(question: str) -> None:
     if not auth_headers:
         st.error("❌ **Authentication Error**: Unable to connect to AI model. Please check your Databricks configuration.")
         st.session_state['adhoc_processing'] = False
+        generation_service.close()
         # Consider adding st.rerun() here if the page should refresh immediately on auth error
         return
     
@@ -251,7 +252,8 @@ def _process_question_async(question: str) -> None:
         success, answer_dict = generation_service._generate_single_answer(
             question=question_dict,
             custom_prompt="",  # No custom prompt for ad hoc questions
-            auth_headers=auth_headers
+            auth_headers=auth_headers,
+            use_cache=False  # Re-asking in chat should get a fresh answer
         )
         
         generation_time = time.time() - processing_start_time
@@ -293,6 +295,7 @@ def _process_question_async(question: str) -> None:
             st.session_state['adhoc_chat_history'] = []
         st.session_state['adhoc_chat_history'].append(error_chat_message)
     finally:
+        generation_service.close()
         # Clear processing state and rerun regardless of success or failure
         st.session_state['adhoc_processing'] = False
         st.session_state['adhoc_current_question'] = ""
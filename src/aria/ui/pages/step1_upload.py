@@ -5,19 +5,206 @@ This module handles the file upload and document name input functionality.
 
 import streamlit as st
 import os
-import time
 from typing import Optional
 from pathlib import Path
 import shutil
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
 
 from aria.ui.state_manager import StateManager
+from aria.ui.components.file_preview import parse_csv, read_csv_cached
 from aria.config.config import (
-    config, SUPPORTED_FILE_TYPES, ERROR_MESSAGES, SUCCESS_MESSAGES,
-    MAX_FILE_SIZE_MB
+    config, SUPPORTED_FILE_TYPES, SUPPORTED_EXTENSIONS, ERROR_FORMATTERS,
+    SUCCESS_MESSAGES, MAX_FILE_SIZE_MB
 )
 from aria.core.logging_config import log_info, log_error, log_success
 from aria.core.exceptions import FileProcessingError, UnsupportedFileTypeError
 
+# Bundled sample CSV at <project root>/assets, resolved once at import
+_SAMPLE_CSV_NAME = "sample-questions.csv"
+try:
+    _SAMPLE_CSV_PATH = Path(__file__).resolve().parents[4] / "assets" / _SAMPLE_CSV_NAME
+except (OSError, IndexError):
+    # Unusual install layout; fall back to the app's working directory
+    _SAMPLE_CSV_PATH = Path("assets") / _SAMPLE_CSV_NAME
+_SAMPLE_CSV_EXISTS = _SAMPLE_CSV_PATH.is_file()
+
+# Buffer size used when streaming uploads to disk
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# Uploads up to this size are written in one call from the uploader's buffer
+_STREAM_THRESHOLD = 8 * _COPY_CHUNK_SIZE
+
+# Worker threads that save large uploads and parse CSVs off the script thread
+_UPLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="upload")
+
+# Session state key holding (path, file_id) of the upload last written to disk
+_SAVED_UPLOAD_KEY = "saved_upload"
+
+# Session state key holding (path, file_id, future) of a background write in flight
+_UPLOAD_WRITE_KEY = "upload_write"
+
+# Session state key holding ((path, mtime_ns, size), future) of the latest CSV prefetch
+_CSV_PREFETCH_KEY = "csv_prefetch"
+
+
+@lru_cache(maxsize=1)
+def _sample_csv_bytes(path_str: str, mtime: float) -> bytes:
+    """Read the sample CSV, caching the contents until the file changes.
+    
+    Args:
+        path_str: Path to the sample CSV
+        mtime: Modification time of the file, part of the cache key
+        
+    Returns:
+        Raw file contents
+    """
+    return Path(path_str).read_bytes()
+
+
+@lru_cache(maxsize=256)
+def _file_extension(name: str) -> str:
+    """Get the lowercased extension of a file name or path, memoized per name.
+    
+    Args:
+        name: File name or path
+        
+    Returns:
+        Extension including the dot (e.g. ``".csv"``), or ``""`` if there is none
+    """
+    base = name.rpartition(os.sep)[2]
+    stem, dot, ext = base.rpartition(".")
+    return f".{ext.lower()}" if dot and stem else ""
+
+
+def _link_sample_csv(dest_path: Path) -> None:
+    """Place the sample CSV at ``dest_path`` with as little I/O as possible.
+    
+    An existing copy of the same size is kept as is. Otherwise the asset is
+    hard-linked, falling back to writing the cached bytes when linking isn't
+    possible (e.g. the temp dir is on another filesystem).
+    
+    Args:
+        dest_path: Destination inside the session temp dir
+    """
+    sample_stat = _SAMPLE_CSV_PATH.stat()
+    if dest_path.exists():
+        if dest_path.stat().st_size == sample_stat.st_size:
+            return
+        dest_path.unlink()
+    try:
+        os.link(_SAMPLE_CSV_PATH, dest_path)
+    except OSError:
+        dest_path.write_bytes(_sample_csv_bytes(str(_SAMPLE_CSV_PATH), sample_stat.st_mtime))
+
+
+def _unlink_if_shared(path: str) -> None:
+    """Remove ``path`` if it is a hard link, so writing to it can't alter the linked asset."""
+    if os.path.exists(path) and os.stat(path).st_nlink > 1:
+        os.unlink(path)
+
+
+def _upload_is_saved(uploaded_file, path: str) -> bool:
+    """Check whether this exact upload has already been written to ``path``.
+    
+    The preview and the submit step both save the same upload. Streamlit gives
+    every upload a new file_id, so an edited file re-uploaded under the same
+    name and size is still written again.
+    
+    Args:
+        uploaded_file: Streamlit uploaded file object
+        path: Destination path
+        
+    Returns:
+        True if the file at ``path`` holds this upload
+    """
+    return (
+        st.session_state.get(_SAVED_UPLOAD_KEY) == (path, uploaded_file.file_id)
+        and os.path.exists(path)
+    )
+
+
+def _mark_upload_saved(uploaded_file, path: str) -> None:
+    """Record that ``uploaded_file`` has been written to ``path``."""
+    st.session_state[_SAVED_UPLOAD_KEY] = (path, uploaded_file.file_id)
+
+
+def _save_upload(uploaded_file, path: str) -> None:
+    """Write an uploaded file to ``path``.
+    
+    Safe to call from a worker thread; callers record the write with
+    _mark_upload_saved on the script thread.
+    
+    Args:
+        uploaded_file: Streamlit uploaded file object
+        path: Destination path
+    """
+    _unlink_if_shared(path)
+    
+    if uploaded_file.size <= _STREAM_THRESHOLD:
+        # getvalue() returns the buffer without moving the stream position
+        Path(path).write_bytes(uploaded_file.getvalue())
+        return
+    
+    # Stream large uploads in 1 MiB chunks rather than copying them in memory
+    uploaded_file.seek(0)
+    with open(path, 'wb') as output_file:
+        shutil.copyfileobj(uploaded_file, output_file, length=_COPY_CHUNK_SIZE)
+    
+    # Reset file pointer for later use
+    uploaded_file.seek(0)
+
+
+def _ensure_upload_saved(uploaded_file, path: str) -> bool:
+    """Save an upload, writing large files on a worker thread.
+    
+    Small uploads are written inline. A large upload is handed to the upload
+    executor; until the write has finished this returns False and the page
+    keeps the submit button disabled, so nothing reads a partially written file.
+    
+    Args:
+        uploaded_file: Streamlit uploaded file object
+        path: Destination path
+        
+    Returns:
+        True once the upload is on disk
+    """
+    if _upload_is_saved(uploaded_file, path):
+        return True
+    
+    if uploaded_file.size <= _STREAM_THRESHOLD:
+        _save_upload(uploaded_file, path)
+        _mark_upload_saved(uploaded_file, path)
+        return True
+    
+    pending = st.session_state.get(_UPLOAD_WRITE_KEY)
+    if pending is None or pending[:2] != (path, uploaded_file.file_id):
+        if pending is not None:
+            # Let a superseded write finish before the path is written again
+            wait([pending[2]])
+        pending = (path, uploaded_file.file_id, _UPLOAD_EXECUTOR.submit(_save_upload, uploaded_file, path))
+        st.session_state[_UPLOAD_WRITE_KEY] = pending
+    
+    future = pending[2]
+    if not future.done():
+        return False
+    
+    st.session_state.pop(_UPLOAD_WRITE_KEY, None)
+    # Surface any error from the background write
+    future.result()
+    _mark_upload_saved(uploaded_file, path)
+    return True
+
+
+def _wait_for_upload_write() -> None:
+    """Wait for the background upload write, then rerun once to enable the submit button."""
+    pending = st.session_state.get(_UPLOAD_WRITE_KEY)
+    if pending is None:
+        return
+    with st.spinner("Saving uploaded file..."):
+        wait([pending[2]])
+    st.rerun()
+
 
 def render_upload_page(state_manager: StateManager) -> None:
     """Render the file upload page.
@@ -44,11 +231,18 @@ def render_upload_page(state_manager: StateManager) -> None:
     # Handle file upload for preview
     if uploaded_file:
         _handle_file_preview(state_manager, uploaded_file)
+    else:
+        # The upload was removed; stop tracking any write still in flight
+        st.session_state.pop(_UPLOAD_WRITE_KEY, None)
     
-    # Process button
-    if st.button("Next step", key="next_step1", type="primary"):
+    # Process button, disabled while a large upload is still being written
+    upload_pending = _UPLOAD_WRITE_KEY in st.session_state
+    if st.button("Next step", key="next_step1", type="primary", disabled=upload_pending):
         if _validate_inputs(rfi_name, uploaded_file):
             _process_upload(state_manager, rfi_name, uploaded_file)
+    
+    if upload_pending:
+        _wait_for_upload_write()
 
 
 def _handle_file_preview(state_manager: StateManager, uploaded_file) -> None:
@@ -63,11 +257,9 @@ def _handle_file_preview(state_manager: StateManager, uploaded_file) -> None:
         temp_dir = state_manager.get_temp_dir()
         temp_file_path = os.path.join(temp_dir, uploaded_file.name)
         
-        with open(temp_file_path, 'wb') as output_file:
-            output_file.write(uploaded_file.read())
-        
-        # Reset file pointer for later use
-        uploaded_file.seek(0)
+        if not _ensure_upload_saved(uploaded_file, temp_file_path):
+            return
+        _prefetch_csv(temp_file_path)
         
         # Update preview only if file changed
         if state_manager.update_file_preview(uploaded_file.name):
@@ -101,9 +293,9 @@ def _validate_inputs(rfi_name: str, uploaded_file) -> bool:
         valid = False
     else:
         # Validate file type
-        file_extension = os.path.splitext(uploaded_file.name)[1].lower()
-        if file_extension not in SUPPORTED_FILE_TYPES:
-            st.error(ERROR_MESSAGES["UNSUPPORTED_FILE_TYPE"].format(file_type=file_extension))
+        file_extension = _file_extension(uploaded_file.name)
+        if file_extension not in SUPPORTED_EXTENSIONS:
+            st.error(ERROR_FORMATTERS["UNSUPPORTED_FILE_TYPE"](file_type=file_extension))
             valid = False
         
         # Validate file size
@@ -129,8 +321,10 @@ def _process_upload(state_manager: StateManager, rfi_name: str, uploaded_file) -
             temp_dir = state_manager.get_temp_dir()
             file_path = os.path.join(temp_dir, uploaded_file.name)
             
-            with open(file_path, 'wb') as output_file:
-                output_file.write(uploaded_file.read())
+            # Reuse the copy written for the preview when it is this upload
+            if not _upload_is_saved(uploaded_file, file_path):
+                _save_upload(uploaded_file, file_path)
+                _mark_upload_saved(uploaded_file, file_path)
             
             # Store information in state
             state_manager.set_document_info(rfi_name.strip(), uploaded_file)
@@ -159,22 +353,21 @@ def _process_sample_csv(state_manager: StateManager, rfi_name: str) -> None:
     """
     try:
         with st.spinner("Loading sample CSV..."):
-            # Resolve path to project root and assets/sample-questions.csv
-            project_root = Path(__file__).resolve().parents[4]
-            sample_path = project_root / "assets" / "sample-questions.csv"
-            if not sample_path.exists():
-                raise FileNotFoundError(f"Sample CSV not found at {sample_path}")
+            if not _SAMPLE_CSV_EXISTS:
+                raise FileNotFoundError(f"Sample CSV not found at {_SAMPLE_CSV_PATH}")
             
             # Copy sample CSV into the app's temp dir so downstream logic treats it like an uploaded file
             temp_dir = state_manager.get_temp_dir()
-            dest_path = Path(temp_dir) / "sample-questions.csv"
-            shutil.copyfile(sample_path, dest_path)
+            dest_path = Path(temp_dir) / _SAMPLE_CSV_NAME
+            _link_sample_csv(dest_path)
+            # The sample may have replaced an upload of the same name
+            st.session_state.pop(_SAVED_UPLOAD_KEY, None)
             
             # Store information in state (use a sentinel to indicate a pseudo-upload)
             doc_name = rfi_name.strip() if rfi_name and rfi_name.strip() else "Sample Questions"
-            state_manager.set_document_info(doc_name, {"source": "sample_csv", "name": "sample-questions.csv"})
+            state_manager.set_document_info(doc_name, {"source": "sample_csv", "name": _SAMPLE_CSV_NAME})
             state_manager.set_file_paths(str(dest_path), str(dest_path))
-            state_manager.update_file_preview("sample-questions.csv")
+            state_manager.update_file_preview(_SAMPLE_CSV_NAME)
             
             # Show preview for CSV files and store df in state
             _show_csv_preview(str(dest_path), state_manager)
@@ -189,6 +382,29 @@ def _process_sample_csv(state_manager: StateManager, rfi_name: str) -> None:
         st.error(f"Error processing sample CSV: {str(e)}")
 
 
+def _csv_version(file_path: str, file_stat: os.stat_result) -> tuple:
+    """Identify one version of a file for matching a background parse."""
+    return (file_path, file_stat.st_mtime_ns, file_stat.st_size)
+
+
+def _prefetch_csv(file_path: str) -> None:
+    """Start parsing an uploaded CSV in the background.
+    
+    The parse overlaps with the user filling in the form; _show_csv_preview
+    picks up the result when the upload is submitted.
+    
+    Args:
+        file_path: Path to the saved upload
+    """
+    if _file_extension(file_path) != '.csv':
+        return
+    version = _csv_version(file_path, os.stat(file_path))
+    prefetch = st.session_state.get(_CSV_PREFETCH_KEY)
+    if prefetch is None or prefetch[0] != version:
+        # Replaces the parse of any earlier version, so only one DataFrame is held
+        st.session_state[_CSV_PREFETCH_KEY] = (version, _UPLOAD_EXECUTOR.submit(parse_csv, file_path))
+
+
 def _show_csv_preview(file_path: str, state_manager: StateManager) -> None:
     """Show preview for CSV files.
     
@@ -196,12 +412,16 @@ def _show_csv_preview(file_path: str, state_manager: StateManager) -> None:
         file_path: Path to the uploaded file
         state_manager: State manager instance
     """
-    file_extension = os.path.splitext(file_path)[1].lower()
+    file_extension = _file_extension(file_path)
     
     if file_extension == '.csv':
         try:
-            import pandas as pd
-            df = pd.read_csv(file_path)
+            file_stat = os.stat(file_path)
+            prefetch = st.session_state.pop(_CSV_PREFETCH_KEY, None)
+            if prefetch is not None and prefetch[0] == _csv_version(file_path, file_stat):
+                df = prefetch[1].result()
+            else:
+                df = read_csv_cached(file_path)
             
             # Store in state for potential use in next step
             state_manager.set("df_input", df)
@@ -11,7 +11,7 @@ from typing import Optional
 from aria.ui.state_manager import StateManager
 from aria.core.logging_config import get_logger
 from aria.services import DocumentProcessor, QuestionExtractionService
-from aria.config.config import ERROR_MESSAGES, SUCCESS_MESSAGES, AVAILABLE_CLAUDE_MODELS, DEFAULT_QUESTION_EXTRACTION_MODEL, DEFAULT_TIMEOUT_SECONDS, SESSION_KEYS
+from aria.config.config import ERROR_MESSAGES, SUCCESS_FORMATTERS, AVAILABLE_CLAUDE_MODELS, DEFAULT_QUESTION_EXTRACTION_MODEL, DEFAULT_TIMEOUT_SECONDS, SESSION_KEYS
 
 logger = get_logger(__name__)
 
@@ -58,7 +58,7 @@ def render_extract_page(state_manager: StateManager) -> None:
             return
     
     # Check if extraction is in progress
-    extraction_in_progress = st.session_state.get(SESSION_KEYS["EXTRACTION_IN_PROGRESS"], False)
+    extraction_in_progress = st.session_state.get(SESSION_KEYS.EXTRACTION_IN_PROGRESS, False)
     
     # If extraction is in progress and we haven't started processing yet, start it
     if extraction_in_progress and not state_manager.has_questions():
@@ -124,7 +124,7 @@ def render_extract_page(state_manager: StateManager) -> None:
             st.info("🔄 Question extraction is currently in progress. Please wait...")
         elif st.button("🔍 Extract Questions", type="primary"):
             # Set extraction flag before starting
-            st.session_state[SESSION_KEYS["EXTRACTION_IN_PROGRESS"]] = True
+            st.session_state[SESSION_KEYS.EXTRACTION_IN_PROGRESS] = True
             _extract_questions(state_manager, doc_processor, extraction_service, custom_prompt)
     
     else:
@@ -199,7 +199,7 @@ def _extract_questions(
     # Check if file path is available
     if not file_path:
         st.error("No file path available. Please upload a file first.")
-        st.session_state[SESSION_KEYS["EXTRACTION_IN_PROGRESS"]] = False
+        st.session_state[SESSION_KEYS.EXTRACTION_IN_PROGRESS] = False
         return
     
     # Get the selected model
@@ -221,7 +221,7 @@ def _extract_questions(
                 for error in preparation["errors"]:
                     st.error(f"• {error}")
                 # Clear extraction flag on error
-                st.session_state[SESSION_KEYS["EXTRACTION_IN_PROGRESS"]] = False
+                st.session_state[SESSION_KEYS.EXTRACTION_IN_PROGRESS] = False
                 return
             
             # Start processing time tracking
@@ -247,7 +247,7 @@ def _extract_questions(
             status_placeholder.empty()
             
             # Clear extraction flag regardless of success/failure
-            st.session_state[SESSION_KEYS["EXTRACTION_IN_PROGRESS"]] = False
+            st.session_state[SESSION_KEYS.EXTRACTION_IN_PROGRESS] = False
             
             if success and questions:
                 # Store questions in state
@@ -260,9 +260,9 @@ def _extract_questions(
                 # Show success message with processing time
                 processing_time = extraction_info.get("processing_time", 0)
                 if processing_time > 0:
-                    st.success(f"✅ {SUCCESS_MESSAGES['QUESTIONS_EXTRACTED'].format(count=len(questions))} (Processing time: {processing_time:.1f}s)")
+                    st.success(f"✅ {SUCCESS_FORMATTERS['QUESTIONS_EXTRACTED'](count=len(questions))} (Processing time: {processing_time:.1f}s)")
                 else:
-                    st.success(SUCCESS_MESSAGES["QUESTIONS_EXTRACTED"].format(count=len(questions)))
+                    st.success(SUCCESS_FORMATTERS["QUESTIONS_EXTRACTED"](count=len(questions)))
                 
                 # Show method used for transparency
                 method_used = extraction_info.get("method", "unknown")
@@ -10,7 +10,7 @@ from typing import Optional
 from aria.ui.state_manager import StateManager
 from aria.core.logging_config import get_logger
 from aria.services import AnswerGenerationService
-from aria.config.config import ERROR_MESSAGES, SUCCESS_MESSAGES, SESSION_KEYS
+from aria.config.config import ERROR_MESSAGES, SUCCESS_FORMATTERS, SESSION_KEYS
 
 logger = get_logger(__name__)
 
@@ -32,27 +32,26 @@ def render_generate_page(state_manager: StateManager) -> None:
         return
     
     # Check if generation is in progress
-    generation_in_progress = st.session_state.get(SESSION_KEYS["GENERATION_IN_PROGRESS"], False)
+    generation_in_progress = st.session_state.get(SESSION_KEYS.GENERATION_IN_PROGRESS, False)
     
     # If generation is in progress and we haven't completed yet, start processing
     if generation_in_progress and not state_manager.has_answers():
         _generate_answers_async(state_manager)
         return
     
-    # Initialize service
-    generation_service = AnswerGenerationService()
-    
     # Show questions summary
     questions = state_manager.get_questions()
     st.info(f"Ready to generate answers for **{len(questions)} questions**")
     
-    # Check if answers have already been generated
-    if not state_manager.has_answers():
-        # Show question selection and generation interface
-        _show_generation_interface(state_manager, generation_service, questions)
-    else:
-        # Show generated answers
-        _show_generated_answers(state_manager, generation_service)
+    # Initialize service; its HTTP session is closed when the section finishes
+    with AnswerGenerationService() as generation_service:
+        # Check if answers have already been generated
+        if not state_manager.has_answers():
+            # Show question selection and generation interface
+            _show_generation_interface(state_manager, generation_service, questions)
+        else:
+            # Show generated answers
+            _show_generated_answers(state_manager, generation_service)
     
     # Navigation buttons
     col1, col2 = st.columns([1, 3])
@@ -84,7 +83,7 @@ def _show_generation_interface(
         questions: List of questions
     """
     # Check if generation is in progress
-    generation_in_progress = st.session_state.get(SESSION_KEYS["GENERATION_IN_PROGRESS"], False)
+    generation_in_progress = st.session_state.get(SESSION_KEYS.GENERATION_IN_PROGRESS, False)
     
     # Show questions preview
     with st.expander("📋 Questions to Process", expanded=False):
@@ -138,7 +137,7 @@ def _show_generation_interface(
         st.info("🔄 Answer generation is currently in progress. Please wait...")
     elif st.button("🤖 Generate Answers", type="primary", disabled=selected_count == 0):
         # Set generation flag and store selected data before starting
-        st.session_state[SESSION_KEYS["GENERATION_IN_PROGRESS"]] = True
+        st.session_state[SESSION_KEYS.GENERATION_IN_PROGRESS] = True
         st.session_state["selected_questions_for_generation"] = selected_questions
         st.session_state["custom_prompt_for_generation"] = custom_prompt
         # Immediately rerun to update UI and show disabled button
@@ -154,28 +153,29 @@ def _generate_answers_async(state_manager: StateManager) -> None:
     # Get stored parameters
     selected_questions = st.session_state.get("selected_questions_for_generation", [])
     custom_prompt = st.session_state.get("custom_prompt_for_generation", "")
+    use_cache = not st.session_state.get("regenerate_answers", False)
     
     if not selected_questions:
         st.error("No questions selected for generation")
-        st.session_state[SESSION_KEYS["GENERATION_IN_PROGRESS"]] = False
+        st.session_state[SESSION_KEYS.GENERATION_IN_PROGRESS] = False
         st.rerun()
         return
     
     # Show progress UI
     st.info("🔄 **Answer generation is in progress** - Please do not switch modes or navigate away")
     
-    # Initialize service
-    generation_service = AnswerGenerationService()
-    
-    # Call the actual generation function
-    _generate_answers(state_manager, generation_service, selected_questions, custom_prompt)
+    # Initialize service and call the actual generation function; the
+    # service's HTTP session is closed once the batch finishes
+    with AnswerGenerationService() as generation_service:
+        _generate_answers(state_manager, generation_service, selected_questions, custom_prompt, use_cache)
 
 
 def _generate_answers(
     state_manager: StateManager,
     generation_service: AnswerGenerationService,
     selected_questions: list,
-    custom_prompt: str
+    custom_prompt: str,
+    use_cache: bool = True
 ) -> None:
     """Generate answers for the selected questions.
     
@@ -184,6 +184,7 @@ def _generate_answers(
         generation_service: Answer generation service
         selected_questions: List of selected questions
         custom_prompt: Custom prompt for generation
+        use_cache: Reuse cached responses; False when regenerating
     """
     with st.spinner("Generating answers... This may take several minutes."):
         # Create progress tracking
@@ -201,15 +202,17 @@ def _generate_answers(
             success, answers, generation_info = generation_service.generate_answers(
                 questions=selected_questions,
                 custom_prompt=custom_prompt,
-                progress_callback=progress_callback
+                progress_callback=progress_callback,
+                use_cache=use_cache
             )
             
             # Clear generation flag regardless of success/failure
-            st.session_state[SESSION_KEYS["GENERATION_IN_PROGRESS"]] = False
+            st.session_state[SESSION_KEYS.GENERATION_IN_PROGRESS] = False
             
             # Clean up temporary session state
             st.session_state.pop("selected_questions_for_generation", None)
             st.session_state.pop("custom_prompt_for_generation", None)
+            st.session_state.pop("regenerate_answers", None)
             
             if success and answers:
                 # Store answers in state
@@ -224,7 +227,7 @@ def _generate_answers(
                 status_text.text("✅ Answer generation completed!")
                 
                 # Show success message
-                st.success(SUCCESS_MESSAGES["ANSWERS_GENERATED"].format(count=len(answers)))
+                st.success(SUCCESS_FORMATTERS["ANSWERS_GENERATED"](count=len(answers)))
                 st.balloons()
                 
                 # Log generation info
@@ -281,11 +284,12 @@ def _generate_answers(
                 
         except Exception as e:
             # Clear generation flag on exception
-            st.session_state[SESSION_KEYS["GENERATION_IN_PROGRESS"]] = False
+            st.session_state[SESSION_KEYS.GENERATION_IN_PROGRESS] = False
             
             # Clean up temporary session state
             st.session_state.pop("selected_questions_for_generation", None)
             st.session_state.pop("custom_prompt_for_generation", None)
+            st.session_state.pop("regenerate_answers", None)
             
             progress_bar.progress(0)
             status_text.text("❌ Unexpected error occurred")
@@ -310,7 +314,7 @@ def _show_generated_answers(
         generation_service: Answer generation service
     """
     # Check if generation is in progress
-    generation_in_progress = st.session_state.get(SESSION_KEYS["GENERATION_IN_PROGRESS"], False)
+    generation_in_progress = st.session_state.get(SESSION_KEYS.GENERATION_IN_PROGRESS, False)
     
     st.subheader("🎉 Generated Answers")
     
@@ -337,12 +341,14 @@ def _show_generated_answers(
             st.info("🔄 Regeneration in progress...")
         elif st.button("🔄 Regenerate Answers"):
             # Set generation flag and store regeneration data
-            st.session_state[SESSION_KEYS["GENERATION_IN_PROGRESS"]] = True
+            st.session_state[SESSION_KEYS.GENERATION_IN_PROGRESS] = True
             # Store the current questions and prompt for regeneration
             questions = state_manager.get_questions()
             custom_prompt = state_manager.get_custom_prompt()
             st.session_state["selected_questions_for_generation"] = questions
             st.session_state["custom_prompt_for_generation"] = custom_prompt
+            # Regeneration must reach the model rather than replay cached answers
+            st.session_state["regenerate_answers"] = True
             # Clear existing answers
             state_manager.clear_answers()
             st.rerun()
@@ -4,28 +4,20 @@ This module provides centralized CSS styling for the Streamlit application,
 extracted from the original helpers.py file for better organization.
 """
 
+import re
+from functools import lru_cache
+from typing import Optional
+
 import streamlit as st
-from aria.core.logging_config import log_info
 
 
-def load_custom_css() -> None:
-    """Load custom CSS styling for the application.
-    
-    This function applies comprehensive styling including:
-    - Component styling (buttons, inputs, toggles)
-    - AgGrid table styling
-    - Navigation and stepper styling
-    - Color scheme and typography
+# A plain stylesheet link: Streamlit renders markdown HTML through React, which
+# drops string onload handlers and never renders <noscript> on the client
+FONT_IMPORTS_HTML = """
+    <link href="https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;700&display=swap" rel="stylesheet">
     """
-    css_content = _get_main_css()
-    st.markdown(css_content, unsafe_allow_html=True)
-    log_info("Custom CSS loaded successfully")
 
-
-def load_header_css() -> None:
-    """Load CSS for the application header."""
-    header_css = """
-    <style>
+HEADER_CSS = """
     /* Fully hide Streamlit's system UI */
     header, footer {visibility: hidden;}
 
@@ -57,15 +49,9 @@ def load_header_css() -> None:
         color: #1E88E5;
         margin: 0;
     }
-    </style>
-    """
-    st.markdown(header_css, unsafe_allow_html=True)
-
+"""
 
-def load_sidebar_css() -> None:
-    """Load CSS for the sidebar styling."""
-    sidebar_css = """
-    <style>
+SIDEBAR_CSS = """
     [data-testid="stSidebar"] {
         background-color: #f8f9fa;
         border-right: 1px solid #eaecef;
@@ -81,19 +67,9 @@ def load_sidebar_css() -> None:
         border: none;
         background-color: #e3f2fd;
     }
-    </style>
-    """
-    st.markdown(sidebar_css, unsafe_allow_html=True)
-
+"""
 
-def _get_main_css() -> str:
-    """Get the main CSS content.
-    
-    Returns:
-        CSS content as string
-    """
-    return """
-    <style>
+MAIN_CSS = """
     /* Force all toggle text to black+bold */
     [data-testid="stToggle"] label, 
     [data-testid="stToggle"] label * {
@@ -446,40 +422,77 @@ def _get_main_css() -> str:
     .ag-theme-streamlit .ag-cell {
         color: #111111 !important;
     }
-    </style>
+"""
+
+STEP4_CSS = """
+    /* Simple fixes for text visibility in Step 4 */
+    .step4-content {
+        color: #333333 !important;
+        background-color: white !important;
+        padding: 8px;
+        margin: 4px 0;
+        border-radius: 4px;
+    }
+    .step4-section {
+        margin-top: 20px;
+        margin-bottom: 10px;
+    }
+"""
+
+# Step-specific CSS appended after the shared styles
+STEP_CSS = {
+    4: STEP4_CSS,
+}
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_SPACE_RE = re.compile(r"\s*([{};])\s*")
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a CSS block.
+    
+    Args:
+        css: CSS source
+        
+    Returns:
+        Minified CSS
     """
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    return _CSS_PUNCT_SPACE_RE.sub(r"\1", css).strip()
+
 
+# Minified CSS for the combined style block, built once at import
+_SHARED_CSS_MIN = _minify_css(MAIN_CSS + HEADER_CSS + SIDEBAR_CSS)
+_STEP_CSS_MIN = {step: _minify_css(css) for step, css in STEP_CSS.items()}
 
-def apply_step_specific_css(step: int) -> None:
-    """Apply step-specific CSS styling.
+@lru_cache(maxsize=None)
+def get_composed_css(step: Optional[int] = None) -> str:
+    """Get the shared CSS plus any step-specific CSS as one style block.
     
     Args:
-        step: Current step number
+        step: Current step number, or None outside the document workflow
+        
+    Returns:
+        CSS content wrapped in a single ``<style>`` element
     """
-    if step == 4:
-        # Step 4 specific styling
-        step4_css = """
-        <style>
-        /* Simple fixes for text visibility in Step 4 */
-        .step4-content {
-            color: #333333 !important;
-            background-color: white !important;
-            padding: 8px;
-            margin: 4px 0;
-            border-radius: 4px;
-        }
-        .step4-section {
-            margin-top: 20px;
-            margin-bottom: 10px;
-        }
-        </style>
-        """
-        st.markdown(step4_css, unsafe_allow_html=True)
-
-
-def load_font_imports() -> None:
-    """Load Google Fonts imports."""
-    font_css = """
-    <link href="https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;700&display=swap" rel="stylesheet">
+    return f"<style>{_SHARED_CSS_MIN}{_STEP_CSS_MIN.get(step, '')}</style>"
+
+
+@lru_cache(maxsize=None)
+def _app_css_html(step: Optional[int]) -> str:
+    """Get the font imports and composed CSS as one markdown payload."""
+    return FONT_IMPORTS_HTML.strip() + get_composed_css(step)
+
+
+def load_app_css(step: Optional[int] = None) -> None:
+    """Load fonts and all application CSS with a single style injection.
+    
+    Streamlit drops elements that a rerun doesn't emit again, so the markdown
+    call itself runs every time; only the HTML is cached.
+    
+    Args:
+        step: Current step number, or None outside the document workflow
     """
-    st.markdown(font_css, unsafe_allow_html=True) 
\ No newline at end of file
+    st.markdown(_app_css_html(step), unsafe_allow_html=True)
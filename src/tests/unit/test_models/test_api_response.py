@@ -0,0 +1,26 @@
+"""Tests for APIResponse text extraction."""
+
+from aria.core.types import APIResponse
+
+
+class TestAPIResponseTextContent:
+    """Tests for APIResponse.get_text_content."""
+    
+    def test_message_format(self):
+        response = APIResponse.from_json(b'{"choices":[{"message":{"content":"hi"}}]}')
+        assert response.get_text_content() == "hi"
+    
+    def test_text_format(self):
+        response = APIResponse.from_json(b'{"choices":[{"text":"hello"}]}')
+        assert response.get_text_content() == "hello"
+    
+    def test_unrecognised_choice_shape(self):
+        response = APIResponse.from_json(b'{"choices":[{"index":0}]}')
+        assert response.get_text_content() is None
+    
+    def test_no_choices(self):
+        assert APIResponse(choices=[]).get_text_content() is None
+    
+    def test_model_construct_uses_choice_shape(self):
+        response = APIResponse.model_construct(choices=[{"text": "constructed"}])
+        assert response.get_text_content() == "constructed"
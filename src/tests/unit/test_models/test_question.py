@@ -0,0 +1,60 @@
+"""Tests for Question.from_dataframe."""
+
+import pandas as pd
+import pytest
+
+from aria.core.exceptions import QuestionExtractionError
+from aria.core.types import Question
+
+
+class TestQuestionFromDataframe:
+    """Tests for Question.from_dataframe."""
+    
+    def test_numeric_ids_become_strings(self):
+        df = pd.DataFrame({'id': [1, 2], 'text': ["First?", "Second?"]})
+        
+        questions = Question.from_dataframe(df)
+        
+        assert [q.id for q in questions] == ["1", "2"]
+    
+    def test_float_ids_from_missing_values_drop_the_fraction(self):
+        df = pd.DataFrame({'id': [1, 2], 'text': ["First?", "Second?"], 'topic': ["A", None]})
+        df['id'] = df['id'].astype(float)
+        
+        questions = Question.from_dataframe(df)
+        
+        assert [q.id for q in questions] == ["1", "2"]
+    
+    def test_nan_optional_values_become_none(self):
+        df = pd.DataFrame({
+            'id': ["Q1", "Q2"],
+            'text': ["First?", "Second?"],
+            'topic': ["Data", float("nan")],
+            'sub_question': [float("nan"), "2.1"],
+        })
+        
+        questions = Question.from_dataframe(df)
+        
+        assert questions[0].topic == "Data"
+        assert questions[0].sub_question is None
+        assert questions[1].topic is None
+        assert questions[1].sub_question == "2.1"
+    
+    def test_text_is_stripped(self):
+        df = pd.DataFrame({'id': ["Q1"], 'text': ["  Padded?  "]})
+        
+        assert Question.from_dataframe(df)[0].text == "Padded?"
+    
+    def test_empty_text_lists_every_offending_row(self):
+        df = pd.DataFrame({'id': ["Q1", "Q2", "Q3"], 'text': ["Fine?", "   ", float("nan")]})
+        
+        with pytest.raises(QuestionExtractionError) as exc_info:
+            Question.from_dataframe(df)
+        
+        assert exc_info.value.details["rows"] == [1, 2]
+    
+    def test_missing_id_raises_extraction_error(self):
+        df = pd.DataFrame({'id': ["Q1", float("nan")], 'text': ["First?", "Second?"]})
+        
+        with pytest.raises(QuestionExtractionError):
+            Question.from_dataframe(df)
@@ -0,0 +1,83 @@
+"""Tests for concurrent answer generation."""
+
+import time
+
+import pytest
+
+from aria.services.answer_generation import AnswerGenerationService
+
+
+@pytest.fixture
+def service():
+    with AnswerGenerationService() as generation_service:
+        generation_service.max_concurrency = 4
+        yield generation_service
+
+
+class TestRunConcurrently:
+    """Tests for AnswerGenerationService._run_concurrently."""
+    
+    def test_results_keep_item_order(self, service):
+        # Earlier items sleep longer, so they finish last
+        items = [0.05, 0.04, 0.03, 0.02, 0.01, 0.0]
+        
+        def work(delay):
+            time.sleep(delay)
+            return delay
+        
+        progress = []
+        results = service._run_concurrently(
+            work, items, lambda current, total, status: progress.append((current, total)), str
+        )
+        
+        assert results == items
+        assert progress == [(i, len(items)) for i in range(1, len(items) + 1)]
+    
+    def test_empty_items(self, service):
+        assert service._run_concurrently(lambda item: item, [], None, str) == []
+    
+    def test_progress_callback_error_cancels_queued_calls(self, service):
+        service.max_concurrency = 1
+        started = []
+        
+        def work(item):
+            started.append(item)
+            time.sleep(0.01)
+            return item
+        
+        def progress_callback(current, total, status):
+            raise RuntimeError("script stopped")
+        
+        with pytest.raises(RuntimeError):
+            service._run_concurrently(work, list(range(10)), progress_callback, str)
+        
+        time.sleep(0.05)
+        assert len(started) < 10
+
+
+class TestGenerateIndividual:
+    """Tests for AnswerGenerationService._generate_individual."""
+    
+    def test_failed_questions_get_placeholders_in_place(self, service, monkeypatch):
+        def fake_single_answer(question, custom_prompt, auth_headers, use_cache=True):
+            if question['text'] == "fail":
+                return False, {}
+            return True, service._build_answer(question, f"answer to {question['text']}")
+        
+        monkeypatch.setattr(service, "_generate_single_answer", fake_single_answer)
+        questions = [
+            {'id': 'Q1', 'text': "first"},
+            {'id': 'Q2', 'text': "fail"},
+            {'id': 'Q3', 'text': "first"},
+        ]
+        
+        success, answers = service._generate_individual(questions, "", {})
+        
+        assert success
+        assert [answer['answer'] for answer in answers] == [
+            "answer to first",
+            "Error: Failed to generate answer",
+            "answer to first",
+        ]
+        assert answers[1]['question_id'] == 'Q2'
+        assert answers[2]['question_id'] == 'Q3'